@@ -1,7 +1,8 @@
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Header, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Query, Request, Response, status
 
+from app.core.response import JSONBytesResponse
 from app.dependencies.auth import AuthorityChecker, SuperManagerOnly, get_admin_id, get_operator
 from app.schemas.admin import (
     AdminChangePassword,
@@ -25,6 +26,7 @@ from app.services.admin import (
     update_admin,
 )
 from app.types.base import AuthorityEnum
+from app.utils.etag import SerializedResult, check_not_modified
 
 admin_router = APIRouter(tags=["관리자"])
 
@@ -32,14 +34,19 @@ admin_router = APIRouter(tags=["관리자"])
 @admin_router.get(
     "/v1/admins",
     name="리스트 조회",
+    response_model=ListResult[AdminResponse],
     dependencies=[
         Depends(AuthorityChecker([AuthorityEnum.ADMIN_VIEW])),
     ],
 )
 async def _get_admins(
     request: Annotated[AdminListRequest, Depends()],
-) -> ListResult[AdminResponse]:
-    return await get_admins(request)
+    http_request: Request,
+    response: Response,
+) -> JSONBytesResponse:
+    result = SerializedResult.from_model(await get_admins(request))
+    check_not_modified(http_request, response, result)
+    return JSONBytesResponse(result.body, headers=response.headers)
 
 
 @admin_router.get(
@@ -65,12 +72,19 @@ async def _renew_token(
 @admin_router.get(
     "/v1/admins/{admin_id}",
     name="상세 조회",
+    response_model=AdminResponse,
     dependencies=[
         Depends(AuthorityChecker([AuthorityEnum.ADMIN_VIEW])),
     ],
 )
-async def _get_admin(admin_id: int) -> AdminResponse:
-    return await get_admin(admin_id)
+async def _get_admin(
+    admin_id: int,
+    http_request: Request,
+    response: Response,
+) -> JSONBytesResponse:
+    result = SerializedResult.from_model(await get_admin(admin_id))
+    check_not_modified(http_request, response, result)
+    return JSONBytesResponse(result.body, headers=response.headers)
 
 
 @admin_router.post(
@@ -1,12 +1,14 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 
+from app.core.response import JSONBytesResponse
 from app.dependencies.auth import AuthorityChecker, get_admin_id
 from app.schemas.base import ListResult
 from app.schemas.notice import NoticeCreate, NoticeListRequest, NoticeResponse
 from app.services.notice import create_notice, get_notice, get_notices, remove_notice, update_notice
 from app.types.base import AuthorityEnum
+from app.utils.etag import check_not_modified
 
 notice_router = APIRouter(tags=["공지사항"])
 
@@ -14,21 +16,31 @@ notice_router = APIRouter(tags=["공지사항"])
 @notice_router.get(
     "/v1/notices",
     name="공지사항 목록 조회",
+    response_model=ListResult[NoticeResponse],
 )
 async def _get_notices(
     request: Annotated[NoticeListRequest, Depends()],
-) -> ListResult[NoticeResponse]:
-    return await get_notices(request)
+    http_request: Request,
+    response: Response,
+) -> JSONBytesResponse:
+    result = await get_notices(request)
+    check_not_modified(http_request, response, result)
+    return JSONBytesResponse(result.body, headers=response.headers)
 
 
 @notice_router.get(
     "/v1/notices/{notice_id}",
     name="공지사항 상세 조회",
+    response_model=NoticeResponse,
 )
 async def _get_notice(
     notice_id: int,
-) -> NoticeResponse:
-    return await get_notice(notice_id)
+    http_request: Request,
+    response: Response,
+) -> JSONBytesResponse:
+    result = await get_notice(notice_id)
+    check_not_modified(http_request, response, result)
+    return JSONBytesResponse(result.body, headers=response.headers)
 
 
 @notice_router.post(
@@ -1,7 +1,8 @@
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Header, Path, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Path, Query, Request, Response, status
 
+from app.core.response import JSONBytesResponse
 from app.dependencies.auth import AuthorityChecker, get_operator, get_user_id
 from app.schemas.base import ListResult, Operator, Token
 from app.schemas.user import (
@@ -25,6 +26,7 @@ from app.services.user import (
     update_user,
 )
 from app.types.base import AuthorityEnum
+from app.utils.etag import SerializedResult, check_not_modified
 
 user_router = APIRouter(tags=["유저"])
 
@@ -32,14 +34,19 @@ user_router = APIRouter(tags=["유저"])
 @user_router.get(
     "/v1/users",
     name="리스트 조회",
+    response_model=ListResult[UserResponse],
     dependencies=[
         Depends(AuthorityChecker([AuthorityEnum.USER_VIEW])),
     ],
 )
 async def _get_users(
     request: Annotated[UserListRequest, Depends()],
-) -> ListResult[UserResponse]:
-    return await get_users(request)
+    http_request: Request,
+    response: Response,
+) -> JSONBytesResponse:
+    result = SerializedResult.from_model(await get_users(request))
+    check_not_modified(http_request, response, result)
+    return JSONBytesResponse(result.body, headers=response.headers)
 
 
 @user_router.get(
@@ -65,12 +72,19 @@ async def _renew_token(
 @user_router.get(
     "/v1/users/{user_id}",
     name="상세 조회",
+    response_model=UserResponse,
     dependencies=[
         Depends(AuthorityChecker([AuthorityEnum.USER_VIEW])),
     ],
 )
-async def _get_user(user_id: Annotated[int, Path(ge=1)]) -> UserResponse:
-    return await get_user(user_id)
+async def _get_user(
+    user_id: Annotated[int, Path(ge=1)],
+    http_request: Request,
+    response: Response,
+) -> JSONBytesResponse:
+    result = SerializedResult.from_model(await get_user(user_id))
+    check_not_modified(http_request, response, result)
+    return JSONBytesResponse(result.body, headers=response.headers)
 
 
 @user_router.post(
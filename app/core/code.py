@@ -11,6 +11,8 @@ class Code(StrEnum):
     INVALID_ACCESS = "잘못된 접근"
     INVALID_PASSWORD = "잘못된 비밀번호"
     INVALID_PARAMETER = "잘못된 요청 값"
+    INVALID_CURSOR = "잘못된 커서 값"
+    INVALID_ORDERING = "지원하지 않는 정렬 값"
     CANNOT_UPDATE_YOURSELF = "자신의 정보는 변경 불가능"
     CANNOT_REMOVE_YOURSELF = "자신의 정보는 삭제 불가능"
     ALREADY_JOINED_ACCOUNT = "이미 가입된 계정"
@@ -30,6 +30,26 @@ class Settings(BaseSettings):
     db_max_overflow: int
     db_pool_recycle: int
 
+    db_readonly_pool_size: int = 6
+    db_readonly_max_overflow: int = 13
+    db_count_pool_size: int = 3
+    db_count_max_overflow: int = 7
+
+    access_token_cache_size: int = 10_000
+    password_hash_max_workers: int = 2
+    list_count_cache_ttl: int = 30
+    list_concurrent_count: bool = True
+    fulltext_min_term_length: int = 2
+    operator_cache_size: int = 10_000
+    operator_cache_ttl: int = 300
+    notice_cache_size: int = 1_000
+    notice_cache_ttl: int = 300
+
+    log_queue_size: int = 10_000
+    access_log_sample_rate: float = 1.0
+    access_log_slow_ms: float = 1_000
+    sql_debug_header_enabled: bool = False
+
     cors_origins: str = "http://localhost:3000"
 
     model_config = SettingsConfigDict(
@@ -46,3 +46,11 @@ class UnknownSystemException500(AppException):
         data: dict | list | None = None,
     ):
         super().__init__(code, data)
+
+
+class NotModifiedException304(Exception):
+    """304 Not Modified exception. (조건부 요청의 검증자가 현재 버전과 일치)"""
+
+    def __init__(self, headers: dict[str, str]):
+        self.headers = headers
+        super().__init__("Not Modified")
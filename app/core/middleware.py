@@ -0,0 +1,115 @@
+import time
+from contextlib import nullcontext
+from random import getrandbits, random
+from urllib.parse import parse_qsl
+
+import structlog
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+from app.dependencies.logger import sql_debug_logging
+from app.dependencies.query_stats import QueryStats, track_query_stats
+from app.utils.password import password_hash_executor
+
+log = structlog.get_logger()
+
+SENSITIVE_PARAMS = ("password", "token")
+SQL_DEBUG_HEADER = b"x-debug-sql"
+
+
+class ProcessTimeMiddleware:
+    """요청마다 trace_id 를 바인딩하고, 처리 시간을 X-Process-Time 헤더와 로그로 남기는 순수 ASGI 미들웨어
+
+    BaseHTTPMiddleware 와 달리 요청/응답을 별도 task 와 stream 으로 감싸지 않는다.
+    access log 는 access_log_sample_rate 비율로만 남기되, 4xx/5xx 와 access_log_slow_ms 이상 걸린 요청은 항상 남긴다.
+    sql_debug_header_enabled 가 켜져 있으면 X-Debug-Sql: true 헤더를 보낸 요청의 SQL 만 로그로 남긴다.
+    요청 중 실행된 쿼리 수/DB 시간/행 수/풀 대기 시간은 Server-Timing 헤더와 request_completed 로그에 포함된다.
+    request_completed 로그에는 비밀번호 해시 스레드 풀의 실행 중/대기 중 작업 수도 함께 남긴다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        settings = get_settings()
+        self.sample_rate = settings.access_log_sample_rate
+        self.slow_ms = settings.access_log_slow_ms
+        self.sql_debug_header_enabled = settings.sql_debug_header_enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path_and_query = scope["path"]
+        query_string = scope["query_string"]
+        if query_string:
+            path_and_query += f"?{query_string.decode('latin-1')}"
+
+        # 보안 목적이 아닌 추적용 ID 이므로 uuid4(os.urandom) 대신 가벼운 난수를 사용
+        trace_id = f"{getrandbits(128):032x}"
+        scope.setdefault("state", {})["trace_id"] = trace_id
+        structlog.contextvars.clear_contextvars()
+        structlog.contextvars.bind_contextvars(trace_id=trace_id)
+
+        # 요청 파라미터 로깅 (민감한 정보 필터링)
+        safe_params = (
+            {
+                k: "***" if k.lower() in SENSITIVE_PARAMS else v
+                for k, v in parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)
+            }
+            if query_string
+            else {}
+        )
+        method = scope["method"]
+        sampled = self.sample_rate >= 1 or random() < self.sample_rate
+        if sampled:
+            log.info("request_started", method=method, path=path_and_query, params=safe_params)
+
+        start_time = time.perf_counter()
+        status_code: int | None = None
+        process_time_ms = 0.0
+        stats = QueryStats()
+
+        async def send_with_process_time(message: Message) -> None:
+            nonlocal status_code, process_time_ms
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time_ms = (time.perf_counter() - start_time) * 1000
+                headers = MutableHeaders(scope=message)
+                headers["X-Process-Time"] = str(process_time_ms)
+                headers.append("Server-Timing", stats.to_server_timing())
+            await send(message)
+
+        with (
+            track_query_stats(stats),
+            sql_debug_logging() if self._is_sql_debug_requested(scope) else nullcontext(),
+        ):
+            await self.app(scope, receive, send_with_process_time)
+
+        if sampled:
+            log.info(
+                "request_completed",
+                method=method,
+                path=path_and_query,
+                status=status_code,
+                time_ms=round(process_time_ms, 2),
+                **stats.to_log_fields(),
+                **password_hash_executor.to_log_fields(),
+            )
+        elif (status_code or 500) >= 400 or process_time_ms >= self.slow_ms:
+            # request_started 를 남기지 않았으므로 요청 파라미터를 함께 남긴다
+            log.info(
+                "request_completed",
+                method=method,
+                path=path_and_query,
+                params=safe_params,
+                status=status_code,
+                time_ms=round(process_time_ms, 2),
+                **stats.to_log_fields(),
+                **password_hash_executor.to_log_fields(),
+            )
+
+    def _is_sql_debug_requested(self, scope: Scope) -> bool:
+        if not self.sql_debug_header_enabled:
+            return False
+        return any(name == SQL_DEBUG_HEADER and value.lower() in (b"1", b"true") for name, value in scope["headers"])
@@ -0,0 +1,17 @@
+from typing import Any
+
+from orjson import OPT_NON_STR_KEYS, dumps
+from starlette.responses import JSONResponse, Response
+
+
+class OrjsonResponse(JSONResponse):
+    """stdlib json 대신 orjson 으로 본문을 직렬화하는 JSONResponse"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content, option=OPT_NON_STR_KEYS)
+
+
+class JSONBytesResponse(Response):
+    """이미 JSON bytes 로 직렬화된 본문을 다시 검증/직렬화하지 않고 그대로 내보내는 응답"""
+
+    media_type = "application/json"
@@ -10,16 +10,29 @@ from app.core.exception import (
 )
 from app.schemas.base import AccessTokenClaims, Operator
 from app.types.base import AuthorityEnum, UserTypeEnum
-from app.utils.jwt import get_access_token_claims, is_validated_jwt
+from app.utils.jwt import get_verified_access_token_claims
 
 log = get_logger()
 
 
+def get_request_claims(request: Request, access_token: str | None = None) -> AccessTokenClaims:
+    """요청 당 한 번만 access token 을 검증하고, 검증된 claims 를 request.state 에 보관"""
+    claims: AccessTokenClaims | None = getattr(request.state, "access_token_claims", None)
+    if claims is not None:
+        return claims
+
+    if access_token is None:
+        _scheme, access_token = get_authorization_scheme_param(request.headers.get("Authorization"))
+    claims = get_verified_access_token_claims(access_token)
+    if claims is None:
+        raise UnauthorizedException401(Code.EXPIRED_TOKEN)
+
+    request.state.access_token_claims = claims
+    return claims
+
+
 def get_operator(request: Request) -> Operator:
-    authorization = request.headers.get("Authorization")
-    _scheme, credentials = get_authorization_scheme_param(authorization)
-    claims = get_access_token_claims(credentials)
-    return Operator.model_validate(claims.model_dump())
+    return Operator.model_validate(get_request_claims(request))
 
 
 def get_admin_id(request: Request) -> int:
@@ -44,10 +57,9 @@ class JWTToken(HTTPBearer):
         request: Request,
     ) -> HTTPAuthorizationCredentials | None:
         credentials = await self.authenticate(request)
-        if self.is_authorized(credentials):
-            return credentials
-
-        raise ForbiddenException403()
+        # 검증된 claims 는 request.state 에 보관되어 이후 dependency 에서 재사용됨
+        get_request_claims(request, credentials.credentials)
+        return credentials
 
     async def authenticate(self, request: Request) -> HTTPAuthorizationCredentials:
         credentials = await super().__call__(request)
@@ -55,13 +67,6 @@ class JWTToken(HTTPBearer):
             raise UnauthorizedException401()
         return credentials
 
-    @staticmethod
-    def is_authorized(credentials: HTTPAuthorizationCredentials) -> bool:
-        access_token = credentials.credentials
-        if not is_validated_jwt(access_token):
-            raise UnauthorizedException401(Code.EXPIRED_TOKEN)
-        return True
-
 
 verify_jwt = JWTToken()
 
@@ -78,21 +83,21 @@ class AuthorityChecker:
         request: Request,
         credentials: HTTPAuthorizationCredentials = Depends(verify_jwt),
     ) -> HTTPAuthorizationCredentials | None:
-        if not self.require_authorities or self.is_authorized(credentials):
+        # JWT 검증은 verify_jwt dependency에서 이미 완료됨
+        claims = get_request_claims(request)
+        if not self.require_authorities or self.is_authorized(claims):
             return credentials
         log.warning(
             "insufficient_authorities",
             required=self.require_authorities,
-            actual=get_access_token_claims(credentials.credentials).authorities,
+            actual=claims.authorities,
         )
         raise ForbiddenException403()
 
     def is_authorized(
         self,
-        credentials: HTTPAuthorizationCredentials,
+        claims: AccessTokenClaims,
     ) -> bool:
-        # JWT 검증은 verify_jwt dependency에서 이미 완료됨
-        claims = get_access_token_claims(credentials.credentials)
         if claims.manager_flag:
             return True
 
@@ -114,14 +119,13 @@ class SuperManagerOnly:
         request: Request,
         credentials: HTTPAuthorizationCredentials = Depends(verify_jwt),
     ) -> HTTPAuthorizationCredentials | None:
-        if self.is_authorized(credentials):
+        # JWT 검증은 verify_jwt dependency에서 이미 완료됨
+        if self.is_authorized(get_request_claims(request)):
             return credentials
         raise ForbiddenException403()
 
     @staticmethod
-    def is_authorized(credentials: HTTPAuthorizationCredentials) -> bool:
-        # JWT 검증은 verify_jwt dependency에서 이미 완료됨
-        claims = get_access_token_claims(credentials.credentials)
+    def is_authorized(claims: AccessTokenClaims) -> bool:
         result = bool(claims.manager_flag)
         if not result:
             log.warning("unauthorized_access", reason="not_super_admin", user_id=claims.id)
@@ -1,14 +1,15 @@
-from collections.abc import Iterator
-from concurrent.futures import ThreadPoolExecutor
-from contextlib import contextmanager, suppress
-from typing import Any, cast
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
 
 from orjson import dumps, loads
-from sqlalchemy import URL, CursorResult, Engine, create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from structlog import get_logger
 
 from app.core.config import get_settings
+from app.core.exception import AppException
+from app.dependencies.query_stats import StatsAsyncAdaptedQueuePool, instrument_engine
 
 log = get_logger()
 
@@ -19,42 +20,40 @@ def custom_json_serializer(obj: Any) -> str:
     return dumps(obj).decode()
 
 
-class ReadonlySession(Session):
-    """읽기 전용 세션을 위한 커스텀 세션 클래스"""
+class AsyncDatabaseSessionManager:
+    """aiomysql 기반 비동기 세션 매니저 (이벤트 루프를 블로킹하지 않음)"""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-    def execute(self, *args, **kwargs) -> CursorResult[Any]:
-        """쿼리 실행을 자동으로 병렬 처리"""
-        future = db_manager._thread_pool.submit(super().execute, *args, **kwargs)
-        return cast("CursorResult[Any]", future.result())
-
-
-class DatabaseSessionManager:
     def __init__(self) -> None:
         self.config = get_settings()
-        self._default_engine: Engine | None = None
-        self._readonly_engine: Engine | None = None
-        self._default_session_factory: sessionmaker | None = None
-        self._readonly_session_factory: sessionmaker | None = None
-        self._thread_pool = ThreadPoolExecutor(max_workers=self.config.db_pool_size, thread_name_prefix="db_readonly_")
-
-    def close(self) -> None:
+        self._default_engine: AsyncEngine | None = None
+        self._readonly_engine: AsyncEngine | None = None
+        self._default_session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._readonly_session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._count_engine: AsyncEngine | None = None
+        self._count_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+    async def close(self) -> None:
         """Clean up resources"""
-        if self._thread_pool:
-            self._thread_pool.shutdown(wait=True)
         if self._default_engine:
-            self._default_engine.dispose()
+            await self._default_engine.dispose()
         if self._readonly_engine:
-            self._readonly_engine.dispose()
-
-    def _create_engine(self, readonly: bool = False) -> Engine:
-        pool_size = int(self.config.db_pool_size * (2 / 3 if readonly else 1 / 3))
-        max_overflow = int(self.config.db_max_overflow * (2 / 3 if readonly else 1 / 3))
+            await self._readonly_engine.dispose()
+        if self._count_engine:
+            await self._count_engine.dispose()
+
+    def _create_engine(self, readonly: bool = False, count: bool = False) -> AsyncEngine:
+        if count:
+            pool_size = self.config.db_count_pool_size
+            max_overflow = self.config.db_count_max_overflow
+        elif readonly:
+            pool_size = self.config.db_readonly_pool_size
+            max_overflow = self.config.db_readonly_max_overflow
+        else:
+            pool_size = int(self.config.db_pool_size / 3)
+            max_overflow = int(self.config.db_max_overflow / 3)
 
         connection_url = URL.create(
-            "mysql+pymysql",
+            "mysql+aiomysql",
             username=self.config.db_username,
             password=self.config.db_password,
             host=self.config.db_host,
@@ -65,6 +64,7 @@ class DatabaseSessionManager:
         engine_kwargs = {
             "json_serializer": custom_json_serializer,
             "json_deserializer": loads,
+            "poolclass": StatsAsyncAdaptedQueuePool,
             "pool_size": pool_size,
             "max_overflow": max_overflow,
             "pool_recycle": self.config.db_pool_recycle,
@@ -78,23 +78,25 @@ class DatabaseSessionManager:
             }
             engine_kwargs["isolation_level"] = "READ COMMITTED"
 
-        return create_engine(connection_url, **engine_kwargs)
+        engine = create_async_engine(connection_url, **engine_kwargs)
+        instrument_engine(engine.sync_engine)
+        return engine
 
-    def _create_session_factory(self, engine: Engine, readonly: bool = False) -> sessionmaker:
-        return sessionmaker(
+    @staticmethod
+    def _create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+        return async_sessionmaker(
             bind=engine,
-            autocommit=False,
             autoflush=False,
             expire_on_commit=False,
-            class_=ReadonlySession if readonly else Session,
+            class_=AsyncSession,
         )
 
-    def _get_session_factory(self, readonly: bool = False) -> sessionmaker:
+    def _get_session_factory(self, readonly: bool = False) -> async_sessionmaker[AsyncSession]:
         if readonly:
             if not self._readonly_session_factory:
                 if not self._readonly_engine:
                     self._readonly_engine = self._create_engine(readonly=True)
-                self._readonly_session_factory = self._create_session_factory(self._readonly_engine, readonly=True)
+                self._readonly_session_factory = self._create_session_factory(self._readonly_engine)
             return self._readonly_session_factory
 
         if not self._default_session_factory:
@@ -104,44 +106,55 @@ class DatabaseSessionManager:
         return self._default_session_factory
 
     @staticmethod
-    def _handle_session_error(session: Session, error: Exception, readonly: bool) -> None:
-        error_type = "Read operation" if readonly else "Database"
-        log.exception("database_error", error_type=error_type, error=str(error))
+    async def _handle_session_error(session: AsyncSession, error: Exception, readonly: bool) -> None:
+        if not isinstance(error, AppException):
+            error_type = "Read operation" if readonly else "Database"
+            log.exception("database_error", error_type=error_type, error=str(error))
         if not readonly:
-            session.rollback()
+            await session.rollback()
         raise
 
-    def get_session(self, readonly: bool = False) -> Iterator[Session]:
+    @asynccontextmanager
+    async def transactional(self, readonly: bool = False) -> AsyncIterator[AsyncSession]:
         session = self._get_session_factory(readonly=readonly)()
         try:
             yield session
             if not readonly:
-                session.commit()
+                await session.commit()
         except Exception as e:
-            self._handle_session_error(session, e, readonly)
+            await self._handle_session_error(session, e, readonly)
         finally:
-            session.close()
+            await session.close()
+
+    @asynccontextmanager
+    async def count_session(self) -> AsyncIterator[AsyncSession]:
+        """목록 total 집계 전용 읽기 세션
 
-    @contextmanager
-    def transactional(self, readonly: bool = False) -> Iterator[Session]:
-        session_generator = self.get_session(readonly=readonly)
+        목록 쿼리의 커넥션을 잡은 채로 count 커넥션을 기다리므로, 같은 풀을 쓰면 풀 크기만큼 동시 요청이 몰렸을 때
+        서로 커넥션을 기다리다 pool_timeout 으로 실패한다. count 는 별도의 작은 풀에서 실행해 이를 피한다.
+        """
+        if not self._count_session_factory:
+            if not self._count_engine:
+                self._count_engine = self._create_engine(readonly=True, count=True)
+            self._count_session_factory = self._create_session_factory(self._count_engine)
+
+        session = self._count_session_factory()
         try:
-            session = next(session_generator)
             yield session
+        except Exception as e:
+            await self._handle_session_error(session, e, readonly=True)
         finally:
-            with suppress(StopIteration):
-                next(session_generator, None)
+            await session.close()
+
+    async def get_session(self, readonly: bool = False) -> AsyncIterator[AsyncSession]:
+        async with self.transactional(readonly=readonly) as session:
+            yield session
 
 
 # 싱글톤 인스턴스 생성
-db_manager = DatabaseSessionManager()
+async_db_manager = AsyncDatabaseSessionManager()
 
 # FastAPI Dependency
-get_session = db_manager.get_session
-
-
-def get_readonly_session() -> Iterator[Session]:
-    return db_manager.get_session(readonly=True)
-
+get_async_session = async_db_manager.get_session
 
-transactional = db_manager.transactional
+async_transactional = async_db_manager.transactional
@@ -1,9 +1,109 @@
 import logging
+import os
+import sys
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from queue import Empty, Full, Queue
+from threading import Lock, Thread
+from typing import Any, BinaryIO
 
+import orjson
 import structlog
 
+from app.core.config import get_settings
+
+
+class BackgroundLogWriter:
+    """렌더링된 로그 라인을 bounded 큐에 넣고, 백그라운드 스레드에서 모아서 stream 에 쓴다
+
+    큐가 가득 차면 이벤트 루프를 막지 않도록 해당 로그를 버리고, 버린 개수는 이후 log_dropped 로 남긴다.
+    close() 는 여러 번 호출해도 되며, close() 이후에 들어온 로그는 스레드를 다시 띄워서 쓴다.
+    """
+
+    def __init__(self, stream: BinaryIO, maxsize: int) -> None:
+        self.stream = stream
+        self.dropped = 0
+        self._reported_dropped = 0
+        self._queue: Queue[bytes | None] = Queue(maxsize=maxsize)
+        self._lock = Lock()
+        self._thread: Thread | None = None
+        self._start()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="log-writer", daemon=True)
+                self._thread.start()
+
+    def write(self, line: bytes) -> None:
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(line)
+        except Full:
+            self.dropped += 1
+
+    def close(self, timeout: float = 1.0) -> None:
+        """남은 로그를 최대 timeout 초 동안 흘려보내고 스레드를 종료"""
+        with self._lock:
+            if self._thread is None:
+                return
+            try:
+                self._queue.put(None, timeout=timeout)
+            except Full:
+                return
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            line = self._queue.get()
+            lines = []
+            while line is not None:
+                lines.append(line)
+                if len(lines) >= 512:
+                    break
+                try:
+                    line = self._queue.get_nowait()
+                except Empty:
+                    break
+            self._flush(lines)
+            if line is None:
+                return
+
+    def _flush(self, lines: list[bytes]) -> None:
+        if self.dropped != self._reported_dropped:
+            dropped, self._reported_dropped = self.dropped - self._reported_dropped, self.dropped
+            lines.append(orjson.dumps({"event": "log_dropped", "level": "warning", "count": dropped}))
+        if not lines:
+            return
+        try:
+            self.stream.write(b"\n".join(lines) + b"\n")
+            self.stream.flush()
+        except (OSError, ValueError):  # fmt: skip
+            pass
+
+
+class QueueLogger:
+    """structlog 최종 logger: 렌더링된 bytes 를 BackgroundLogWriter 큐에 넣기만 한다"""
+
+    def __init__(self, writer: BackgroundLogWriter) -> None:
+        self._writer = writer
+
+    def msg(self, message: bytes) -> None:
+        self._writer.write(message)
+
+    log = debug = info = warn = warning = msg
+    fatal = failure = err = error = critical = exception = msg
+
+
+log_writer: BackgroundLogWriter | None = None
+
 
 def setup_logger():
+    global log_writer
+
     shared_processors: list[structlog.types.Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
@@ -12,27 +112,83 @@ def setup_logger():
         structlog.processors.TimeStamper(fmt="iso"),
     ]
 
+    settings = get_settings()
+    if settings.deployment_environment in ("local", "test"):
+        structlog.configure(
+            processors=[
+                *shared_processors,
+                structlog.dev.ConsoleRenderer(),
+            ],
+            wrapper_class=structlog.make_filtering_bound_logger(logging.NOTSET),
+            context_class=dict,
+            logger_factory=structlog.PrintLoggerFactory(),
+            cache_logger_on_first_use=True,
+        )
+        return
+
+    # 운영 환경: 한 줄 JSON(orjson)
+    # Lambda 는 핸들러가 반환되면 프로세스가 멈춰 백그라운드 스레드가 남은 로그를 쓰지 못하므로 바로 stdout 에 쓴다
+    logger_factory: Callable[..., Any]
+    if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+        logger_factory = structlog.BytesLoggerFactory(sys.stdout.buffer)
+    else:
+        if log_writer is None:
+            log_writer = BackgroundLogWriter(sys.stdout.buffer, maxsize=settings.log_queue_size)
+        writer = log_writer
+        logger_factory = lambda *_args: QueueLogger(writer)  # noqa: E731
     structlog.configure(
         processors=[
             *shared_processors,
-            structlog.dev.ConsoleRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=orjson.dumps),
         ],
         wrapper_class=structlog.make_filtering_bound_logger(logging.NOTSET),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
 
+def close_logger() -> None:
+    """남은 로그를 흘려보낸다. 여러 번 호출해도 되고, 이후의 로그는 다시 정상적으로 출력된다"""
+    if log_writer is not None:
+        log_writer.close()
+
+
 log = structlog.get_logger()
 
+# SQL 로그는 기본으로 끄고, sql_debug_logging() 으로 켠 요청(context)의 SQL 만 남긴다
 sql_logger = logging.getLogger("sqlalchemy.engine")
-sql_logger.setLevel(logging.INFO)
+sql_logger.setLevel(logging.WARNING)
+
+sql_debug: ContextVar[bool] = ContextVar("sql_debug", default=False)
+_sql_debug_count = 0
+
+
+@contextmanager
+def sql_debug_logging() -> Iterator[None]:
+    global _sql_debug_count
+    token = sql_debug.set(True)
+    _sql_debug_count += 1
+    sql_logger.setLevel(logging.INFO)
+    try:
+        yield
+    finally:
+        _sql_debug_count -= 1
+        if _sql_debug_count == 0:
+            sql_logger.setLevel(logging.WARNING)
+        sql_debug.reset(token)
 
 
 class StructLogHandler(logging.Handler):
     """stdlib 로그를 structlog으로 라우팅하는 핸들러"""
 
+    def filter(self, record: logging.LogRecord) -> bool | logging.LogRecord:
+        # SQL 디버그를 켠 요청이 있는 동안에도 다른 요청의 SQL 로그는 버린다
+        if record.name.startswith("sqlalchemy.engine") and not sql_debug.get():
+            return False
+        return super().filter(record)
+
     def emit(self, record: logging.LogRecord) -> None:
         level = record.levelname.lower()
         logger = structlog.get_logger()
@@ -10,6 +10,10 @@ class TZDateTime(TypeDecorator):
     impl = DateTime
     cache_ok = True
 
+    @property
+    def python_type(self) -> type[datetime]:
+        return datetime
+
     def process_bind_param(self, value, dialect):
         if value is not None:
             if value.tzinfo is None:
@@ -0,0 +1,117 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class QueryStats:
+    """한 요청 동안 실행된 쿼리 수, DB 시간, 반환 행 수, 커넥션 풀 대기 시간 누적값"""
+
+    __slots__ = ("count", "db_time", "pool_wait", "rows")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.db_time = 0.0
+        self.rows = 0
+        self.pool_wait = 0.0
+
+    def to_log_fields(self) -> dict[str, Any]:
+        return {
+            "db_queries": self.count,
+            "db_time_ms": round(self.db_time * 1000, 2),
+            "db_rows": self.rows,
+            "db_pool_wait_ms": round(self.pool_wait * 1000, 2),
+        }
+
+    def to_server_timing(self) -> str:
+        return (
+            f'db;dur={self.db_time * 1000:.2f};desc="{self.count} queries, {self.rows} rows", '
+            f"db-pool;dur={self.pool_wait * 1000:.2f}"
+        )
+
+
+# AsyncSession 은 같은 task 의 context 를 공유하는 greenlet 에서 쿼리를 실행하므로 contextvar 로 요청별 누적이 가능하다
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_query_stats(stats: QueryStats) -> Iterator[QueryStats]:
+    token = query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        query_stats.reset(token)
+
+
+# 바깥 _do_get 이 실행되는 동안 새 커넥션을 만드는 데 쓴 시간 (재귀 호출된 _do_get 에서는 이미 설정되어 있다)
+_connect_time: ContextVar[list[float] | None] = ContextVar("connect_time", default=None)
+
+
+class _PoolWaitMixin:
+    """커넥션을 얻기까지 기다린 시간을 query_stats 에 누적
+
+    QueuePool._do_get 은 overflow 경로에서 자신을 재귀 호출하므로 가장 바깥 호출만 재고,
+    새 커넥션을 만드는 시간(_create_connection)은 대기 시간에서 뺀다.
+    """
+
+    def _do_get(self):  # type: ignore[no-untyped-def]
+        stats = query_stats.get()
+        if stats is None or _connect_time.get() is not None:
+            return super()._do_get()  # type: ignore[misc]
+
+        connect_time = [0.0]
+        token = _connect_time.set(connect_time)
+        start = time.perf_counter()
+        try:
+            return super()._do_get()  # type: ignore[misc]
+        finally:
+            _connect_time.reset(token)
+            stats.pool_wait += time.perf_counter() - start - connect_time[0]
+
+    def _create_connection(self):  # type: ignore[no-untyped-def]
+        connect_time = _connect_time.get()
+        if connect_time is None:
+            return super()._create_connection()  # type: ignore[misc]
+        start = time.perf_counter()
+        try:
+            return super()._create_connection()  # type: ignore[misc]
+        finally:
+            connect_time[0] += time.perf_counter() - start
+
+
+class StatsAsyncAdaptedQueuePool(_PoolWaitMixin, AsyncAdaptedQueuePool):
+    """커넥션을 얻기까지 기다린 시간을 query_stats 에 누적하는 AsyncAdaptedQueuePool"""
+
+
+def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    # 한 커넥션에서 쿼리는 하나씩 실행되므로 시작 시각 하나만 둔다
+    conn.info["query_start_time"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, _statement, _parameters, _context, _executemany) -> None:
+    start_time = conn.info.pop("query_start_time", None)
+    stats = query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        if start_time is not None:
+            stats.db_time += time.perf_counter() - start_time
+        # DML 의 rowcount 는 영향받은 행 수이므로 결과 행이 있는 쿼리만 센다 (버퍼링 커서의 SELECT rowcount 는 반환 행 수)
+        if cursor.description is not None:
+            stats.rows += max(cursor.rowcount, 0)
+
+
+def _handle_error(context) -> None:
+    # 실패한 쿼리에는 after_cursor_execute 가 호출되지 않으므로 풀에 돌아갈 커넥션에 시작 시각을 남기지 않는다
+    if context.connection is not None:
+        context.connection.info.pop("query_start_time", None)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """engine 의 쿼리 실행 시간/건수/행 수를 요청별 query_stats 에 누적"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -1,7 +1,6 @@
-import time
+import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from uuid import uuid4
 
 import sentry_sdk
 import structlog
@@ -14,8 +13,9 @@ from fastapi_events.middleware import EventHandlerASGIMiddleware
 from mangum import Mangum
 from pydantic.alias_generators import to_camel
 from sqlalchemy import text
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from starlette.status import (
+    HTTP_304_NOT_MODIFIED,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_403_FORBIDDEN,
@@ -31,14 +31,18 @@ from app.core.config import get_settings
 from app.core.exception import (
     BadRequestException400,
     ForbiddenException403,
+    NotModifiedException304,
     UnauthorizedException401,
     UnknownSystemException500,
 )
-from app.dependencies.database import db_manager, get_session
-from app.dependencies.logger import setup_logger
+from app.core.middleware import ProcessTimeMiddleware
+from app.core.response import OrjsonResponse
+from app.dependencies.database import async_db_manager, get_async_session
+from app.dependencies.logger import close_logger, setup_logger
 from app.schemas.base import AccessTokenClaims
 from app.types.base import UserTypeEnum
 from app.utils.jwt import create_access_token
+from app.utils.password import password_hash_executor
 
 setup_logger()
 log = structlog.get_logger()
@@ -60,7 +64,11 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     # Startup
     yield
     # Shutdown
-    db_manager.close()
+    await async_db_manager.close()
+    # Lambda 는 호출마다 lifespan 이 실행되므로 스레드 풀을 다음 호출에서 재사용하도록 남겨 둔다
+    if not os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+        password_hash_executor.close()
+    close_logger()
 
 
 app = None
@@ -115,34 +123,7 @@ app.add_middleware(
 )
 
 
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    # Starlette URL 객체에서 경로와 쿼리 파라미터 추출
-    path_and_query = request.url.path
-    if request.url.query:
-        path_and_query += f"?{request.url.query}"
-
-    trace_id = str(uuid4())
-    request.state.trace_id = trace_id
-    structlog.contextvars.clear_contextvars()
-    structlog.contextvars.bind_contextvars(trace_id=trace_id)
-
-    # 요청 파라미터 로깅 (민감한 정보 필터링)
-    safe_params = {k: "***" if k.lower() in ("password", "token") else v for k, v in request.query_params.items()}
-    log.info("request_started", method=request.method, path=path_and_query, params=safe_params)
-
-    start_time = time.perf_counter()
-    response = await call_next(request)
-    process_time_ms = (time.perf_counter() - start_time) * 1000
-    log.info(
-        "request_completed",
-        method=request.method,
-        path=path_and_query,
-        status=response.status_code,
-        time_ms=round(process_time_ms, 2),
-    )
-    response.headers["X-Process-Time"] = str(process_time_ms)
-    return response
+app.add_middleware(ProcessTimeMiddleware)  # type: ignore
 
 
 app.include_router(notice_router, prefix="/api")
@@ -161,7 +142,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     details = exc.errors()
     log.error("validation_error", details=details)
     log.exception(exc)
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=HTTP_422_UNPROCESSABLE_CONTENT,
         content={
             "code": Code.INVALID_PARAMETER,
@@ -175,9 +156,14 @@ def _exc_to_dict(exc: Exception) -> dict:
     return {"code": exc.code, "message": exc.message, "data": exc.data}  # type: ignore[attr-defined]
 
 
+@app.exception_handler(NotModifiedException304)
+async def handle_not_modified_exception(_request: Request, exc: NotModifiedException304):
+    return Response(status_code=HTTP_304_NOT_MODIFIED, headers=exc.headers)
+
+
 @app.exception_handler(BadRequestException400)
 async def handle_exception_400(_request: Request, exc: BadRequestException400):
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=HTTP_400_BAD_REQUEST,
         content=_exc_to_dict(exc),
     )
@@ -185,7 +171,7 @@ async def handle_exception_400(_request: Request, exc: BadRequestException400):
 
 @app.exception_handler(UnauthorizedException401)
 async def handle_expired_token_exception(_request: Request, exc: UnauthorizedException401):
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=HTTP_401_UNAUTHORIZED,
         content=_exc_to_dict(exc),
         headers=({"token": "must-renew"} if exc.code == Code.EXPIRED_TOKEN else {}),
@@ -194,7 +180,7 @@ async def handle_expired_token_exception(_request: Request, exc: UnauthorizedExc
 
 @app.exception_handler(ForbiddenException403)
 async def handle_invalid_authority_exception(_request: Request, exc: ForbiddenException403):
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=HTTP_403_FORBIDDEN,
         content=_exc_to_dict(exc),
     )
@@ -203,20 +189,20 @@ async def handle_invalid_authority_exception(_request: Request, exc: ForbiddenEx
 @app.exception_handler(UnknownSystemException500)
 async def handle_invalid_authentication_exception(_request: Request, exc: UnknownSystemException500):
     sentry_sdk.capture_exception(exc)
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=HTTP_500_INTERNAL_SERVER_ERROR,
         content=_exc_to_dict(exc),
     )
 
 
 @app.get("/health/liveness", include_in_schema=False)
-def liveness():
+def liveness() -> dict[str, str]:
     return {"status": f"{settings.deployment_environment} OK"}
 
 
 @app.get("/health/readiness", include_in_schema=False)
-def readiness(session=Depends(get_session)):
-    session.execute(text("SELECT now()"))
+async def readiness(session=Depends(get_async_session)) -> dict[str, str]:
+    await session.execute(text("SELECT now()"))
     return {"status": f"{settings.deployment_environment} UP"}
 
 
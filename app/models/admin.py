@@ -1,7 +1,8 @@
 from fastapi_events.dispatcher import dispatch
 from pydantic import AwareDatetime
 from sqlalchemy import JSON
-from sqlalchemy.orm import Mapped, mapped_column, object_session, relationship
+from sqlalchemy.ext.asyncio import async_object_session
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.exception import UnknownSystemException500
 from app.dependencies.orm import Base, TZDateTime
@@ -16,7 +17,7 @@ from app.schemas.base import Operator, Token
 from app.types.base import AuthorityEnum, UserTypeEnum
 from app.utils.datetime_utils import utcnow
 from app.utils.jwt import create_access_token, create_refresh_token
-from app.utils.password import get_password_hash
+from app.utils.password import get_password_hash_async
 
 
 class Admin(IdCreatedUpdated, Base):
@@ -39,15 +40,11 @@ class Admin(IdCreatedUpdated, Base):
     removed_flag: Mapped[bool]
     removed_at: Mapped[AwareDatetime | None] = mapped_column(TZDateTime, nullable=True)
 
-    created_by: Mapped[Admin] = relationship(
-        lazy="joined",
-        innerjoin=True,
+    created_by_admin: Mapped[Admin] = relationship(
         viewonly=True,
         primaryjoin="foreign(Admin.created_object_id) == remote(Admin.id)",
     )
-    updated_by: Mapped[Admin] = relationship(
-        lazy="joined",
-        innerjoin=True,
+    updated_by_admin: Mapped[Admin] = relationship(
         viewonly=True,
         primaryjoin="foreign(Admin.updated_object_id) == remote(Admin.id)",
     )
@@ -56,12 +53,24 @@ class Admin(IdCreatedUpdated, Base):
     def type(self):
         return UserTypeEnum.ADMIN
 
+    @property
+    def created_by(self):
+        if (resolved := self.get_resolved_operators()) is not None:
+            return resolved[0]
+        return self.created_by_admin
+
+    @property
+    def updated_by(self):
+        if (resolved := self.get_resolved_operators()) is not None:
+            return resolved[1]
+        return self.updated_by_admin
+
     @property
     def authorities(self):
         return set(AuthorityEnum) if self.manager_flag else self._authorities
 
     @staticmethod
-    def new(
+    async def new(
         data: AdminCreate,
         operator_id: int,
     ) -> Admin:
@@ -69,7 +78,7 @@ class Admin(IdCreatedUpdated, Base):
         return Admin(
             **data.model_dump(exclude={"authorities", "password"}),
             _authorities=data.authorities,
-            password=get_password_hash(data.password.get_secret_value()),
+            password=await get_password_hash_async(data.password.get_secret_value()),
             removed_flag=False,
             joined_at=now,
             created_at=now,
@@ -80,7 +89,7 @@ class Admin(IdCreatedUpdated, Base):
             updated_object_type=UserTypeEnum.ADMIN,
         )
 
-    def update(self, data: AdminUpdate, operator_id: int):
+    async def update(self, data: AdminUpdate, operator_id: int):
         now = utcnow()
         self.login_id = data.login_id
         self.name = data.name
@@ -91,12 +100,12 @@ class Admin(IdCreatedUpdated, Base):
         self.updated_object_id = operator_id
         self.updated_object_type = UserTypeEnum.ADMIN
         if data.password and data.password.get_secret_value():
-            self.password = get_password_hash(data.password.get_secret_value())
+            self.password = await get_password_hash_async(data.password.get_secret_value())
             self.change_password_at = now
 
-    def change_password(self, password: str, operator: Operator):
+    async def change_password(self, password: str, operator: Operator):
         now = utcnow()
-        self.password = get_password_hash(password)
+        self.password = await get_password_hash_async(password)
         self.change_password_at = now
         self.updated_at = now
         self.updated_object_id = operator.id
@@ -117,43 +126,43 @@ class Admin(IdCreatedUpdated, Base):
     def logout(self):
         self.token = None
 
-    def on_created(self) -> AdminResponse:
-        session = object_session(self)
+    async def on_created(self) -> AdminResponse:
+        session = async_object_session(self)
         if not session:
             raise UnknownSystemException500()
-        session.flush()
+        await session.flush()
 
-        event_data = AdminResponse.model_validate(self)
+        event_data = await session.run_sync(lambda _: AdminResponse.model_validate(self))
         dispatch(AdminEvent.ADMIN_CREATED, event_data)
         return event_data
 
-    def on_updated(self) -> AdminResponse:
-        session = object_session(self)
+    async def on_updated(self) -> AdminResponse:
+        session = async_object_session(self)
         if not session:
             raise UnknownSystemException500()
-        session.flush()
+        await session.flush()
 
-        event_data = AdminResponse.model_validate(self)
+        event_data = await session.run_sync(lambda _: AdminResponse.model_validate(self))
         dispatch(AdminEvent.ADMIN_UPDATED, event_data)
         return event_data
 
-    def on_removed(self) -> AdminResponse:
-        session = object_session(self)
+    async def on_removed(self) -> AdminResponse:
+        session = async_object_session(self)
         if not session:
             raise UnknownSystemException500()
-        session.flush()
+        await session.flush()
 
-        event_data = AdminResponse.model_validate(self)
+        event_data = await session.run_sync(lambda _: AdminResponse.model_validate(self))
         dispatch(AdminEvent.ADMIN_REMOVED, event_data)
         return event_data
 
-    def on_logged_in(self) -> Token:
-        session = object_session(self)
+    async def on_logged_in(self) -> Token:
+        session = async_object_session(self)
         if not session:
             raise UnknownSystemException500()
-        session.flush()
+        await session.flush()
 
-        dispatch(AdminEvent.ADMIN_LOGGED_IN, AdminResponse.model_validate(self))
+        dispatch(AdminEvent.ADMIN_LOGGED_IN, await session.run_sync(lambda _: AdminResponse.model_validate(self)))
         if self.token is None:
             raise UnknownSystemException500()
         return Token(
@@ -161,12 +170,12 @@ class Admin(IdCreatedUpdated, Base):
             refresh_token=self.token,
         )
 
-    def on_password_changed(self) -> AdminResponse:
-        session = object_session(self)
+    async def on_password_changed(self) -> AdminResponse:
+        session = async_object_session(self)
         if not session:
             raise UnknownSystemException500()
-        session.flush()
+        await session.flush()
 
-        event_data = AdminResponse.model_validate(self)
+        event_data = await session.run_sync(lambda _: AdminResponse.model_validate(self))
         dispatch(AdminEvent.ADMIN_PASSWORD_CHANGED, event_data)
         return event_data
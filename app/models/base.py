@@ -5,6 +5,7 @@ from app.dependencies.orm import (
     mapped_intpk,
     mapped_updated_at,
 )
+from app.schemas.base import UserSimpleDto
 from app.types.base import UserTypeEnum
 
 
@@ -19,3 +20,13 @@ class IdCreatedUpdated(IdCreated):
     updated_object_type: Mapped[UserTypeEnum]
     updated_at: Mapped[mapped_updated_at]
     updated_object_id: Mapped[int]
+
+    def set_resolved_operators(self, created_by: UserSimpleDto | None, updated_by: UserSimpleDto | None) -> None:
+        """목록에서 한 번에 조회한 생성자/수정자 요약을 보관 (ORM 관계가 아닌 일반 속성)
+
+        created_by/updated_by 는 이 값이 있으면 관계를 읽지 않고 이 값을 반환한다.
+        """
+        self.__dict__["_resolved_operators"] = (created_by, updated_by)
+
+    def get_resolved_operators(self) -> tuple[UserSimpleDto | None, UserSimpleDto | None] | None:
+        return self.__dict__.get("_resolved_operators")
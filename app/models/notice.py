@@ -1,6 +1,7 @@
 from fastapi_events.dispatcher import dispatch
 from pydantic import AwareDatetime
-from sqlalchemy.orm import Mapped, mapped_column, object_session, relationship
+from sqlalchemy.ext.asyncio import async_object_session
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.exception import UnknownSystemException500
 from app.dependencies.orm import Base, TZDateTime
@@ -42,6 +43,8 @@ class Notice(IdCreatedUpdated, Base):
 
     @property
     def created_by(self):
+        if (resolved := self.get_resolved_operators()) is not None:
+            return resolved[0]
         if self.created_object_type == UserTypeEnum.USER:
             return self.created_by_user
         if self.created_object_type == UserTypeEnum.ADMIN:
@@ -50,6 +53,8 @@ class Notice(IdCreatedUpdated, Base):
 
     @property
     def updated_by(self):
+        if (resolved := self.get_resolved_operators()) is not None:
+            return resolved[1]
         if self.updated_object_type == UserTypeEnum.USER:
             return self.updated_by_user
         if self.updated_object_type == UserTypeEnum.ADMIN:
@@ -87,32 +92,32 @@ class Notice(IdCreatedUpdated, Base):
         self.updated_object_id = operator_id
         self.updated_object_type = UserTypeEnum.ADMIN
 
-    def on_created(self) -> NoticeResponse:
-        session = object_session(self)
+    async def on_created(self) -> NoticeResponse:
+        session = async_object_session(self)
         if not session:
             raise UnknownSystemException500()
-        session.flush()
+        await session.flush()
 
-        event_data = NoticeResponse.model_validate(self)
+        event_data = await session.run_sync(lambda _: NoticeResponse.model_validate(self))
         dispatch(NoticeEvent.NOTICE_CREATED, event_data)
         return event_data
 
-    def on_updated(self) -> NoticeResponse:
-        session = object_session(self)
+    async def on_updated(self) -> NoticeResponse:
+        session = async_object_session(self)
         if not session:
             raise UnknownSystemException500()
-        session.flush()
+        await session.flush()
 
-        event_data = NoticeResponse.model_validate(self)
+        event_data = await session.run_sync(lambda _: NoticeResponse.model_validate(self))
         dispatch(NoticeEvent.NOTICE_UPDATED, event_data)
         return event_data
 
-    def on_removed(self) -> NoticeResponse:
-        session = object_session(self)
+    async def on_removed(self) -> NoticeResponse:
+        session = async_object_session(self)
         if not session:
             raise UnknownSystemException500()
-        session.flush()
+        await session.flush()
 
-        event_data = NoticeResponse.model_validate(self)
+        event_data = await session.run_sync(lambda _: NoticeResponse.model_validate(self))
         dispatch(NoticeEvent.NOTICE_REMOVED, event_data)
         return event_data
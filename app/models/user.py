@@ -1,7 +1,8 @@
 from fastapi_events.dispatcher import dispatch
 from pydantic import AwareDatetime
 from sqlalchemy import JSON
-from sqlalchemy.orm import Mapped, mapped_column, object_session, relationship
+from sqlalchemy.ext.asyncio import async_object_session
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.code import Code
 from app.core.exception import BadRequestException400, UnknownSystemException500
@@ -13,7 +14,7 @@ from app.schemas.user import UserChangePassword, UserCreate, UserResponse, UserU
 from app.types.base import AuthorityEnum, UserTypeEnum
 from app.utils.datetime_utils import utcnow
 from app.utils.jwt import create_access_token, create_refresh_token
-from app.utils.password import get_password_hash, verify_password
+from app.utils.password import get_password_hash_async, verify_password_async
 
 
 class User(IdCreatedUpdated, Base):
@@ -61,6 +62,8 @@ class User(IdCreatedUpdated, Base):
 
     @property
     def created_by(self):
+        if (resolved := self.get_resolved_operators()) is not None:
+            return resolved[0]
         if self.created_object_type == UserTypeEnum.USER:
             return self.created_by_user
         if self.created_object_type == UserTypeEnum.ADMIN:
@@ -69,6 +72,8 @@ class User(IdCreatedUpdated, Base):
 
     @property
     def updated_by(self):
+        if (resolved := self.get_resolved_operators()) is not None:
+            return resolved[1]
         if self.updated_object_type == UserTypeEnum.USER:
             return self.updated_by_user
         if self.updated_object_type == UserTypeEnum.ADMIN:
@@ -76,7 +81,7 @@ class User(IdCreatedUpdated, Base):
         raise UnknownSystemException500()
 
     @staticmethod
-    def new(data: UserCreate, operator: Operator):
+    async def new(data: UserCreate, operator: Operator):
         now = utcnow()
         return User(
             name=data.name,
@@ -84,7 +89,7 @@ class User(IdCreatedUpdated, Base):
             login_id=data.login_id,
             authorities=data.authorities,
             token=None,
-            password=get_password_hash(data.password.get_secret_value()),
+            password=await get_password_hash_async(data.password.get_secret_value()),
             change_password_at=now,
             joined_at=now,
             removed_flag=False,
@@ -96,7 +101,7 @@ class User(IdCreatedUpdated, Base):
             updated_object_type=operator.type,
         )
 
-    def update(self, data: UserUpdate, operator: Operator):
+    async def update(self, data: UserUpdate, operator: Operator):
         now = utcnow()
         self.name = data.name
         self.use_flag = data.use_flag
@@ -106,17 +111,17 @@ class User(IdCreatedUpdated, Base):
         self.updated_object_id = operator.id
         self.updated_object_type = operator.type
         if data.password and data.password.get_secret_value():
-            self.password = get_password_hash(data.password.get_secret_value())
+            self.password = await get_password_hash_async(data.password.get_secret_value())
             self.change_password_at = now
 
-    def change_password(self, data: UserChangePassword, operator: Operator):
+    async def change_password(self, data: UserChangePassword, operator: Operator):
         if not self.password:
             raise BadRequestException400(Code.INVALID_PASSWORD)
-        if not verify_password(data.old_password.get_secret_value(), self.password):
+        if not await verify_password_async(data.old_password.get_secret_value(), self.password):
             raise BadRequestException400(Code.INVALID_PASSWORD)
 
         now = utcnow()
-        self.password = get_password_hash(data.new_password.get_secret_value())
+        self.password = await get_password_hash_async(data.new_password.get_secret_value())
         self.change_password_at = now
         self.updated_at = now
         self.updated_object_id = operator.id
@@ -137,53 +142,53 @@ class User(IdCreatedUpdated, Base):
     def logout(self):
         self.token = None
 
-    def on_created(self) -> UserResponse:
-        session = object_session(self)
+    async def on_created(self) -> UserResponse:
+        session = async_object_session(self)
         if not session:
             raise UnknownSystemException500()
-        session.flush()
+        await session.flush()
 
-        event_data = UserResponse.model_validate(self)
+        event_data = await session.run_sync(lambda _: UserResponse.model_validate(self))
         dispatch(UserEvent.USER_CREATED, event_data)
         return event_data
 
-    def on_updated(self) -> UserResponse:
-        session = object_session(self)
+    async def on_updated(self) -> UserResponse:
+        session = async_object_session(self)
         if not session:
             raise UnknownSystemException500()
-        session.flush()
+        await session.flush()
 
-        event_data = UserResponse.model_validate(self)
+        event_data = await session.run_sync(lambda _: UserResponse.model_validate(self))
         dispatch(UserEvent.USER_UPDATED, event_data)
         return event_data
 
-    def on_password_updated(self) -> UserResponse:
-        session = object_session(self)
+    async def on_password_updated(self) -> UserResponse:
+        session = async_object_session(self)
         if not session:
             raise UnknownSystemException500()
-        session.flush()
+        await session.flush()
 
-        event_data = UserResponse.model_validate(self)
+        event_data = await session.run_sync(lambda _: UserResponse.model_validate(self))
         dispatch(UserEvent.USER_PASSWORD_UPDATED, event_data)
         return event_data
 
-    def on_removed(self) -> UserResponse:
-        session = object_session(self)
+    async def on_removed(self) -> UserResponse:
+        session = async_object_session(self)
         if not session:
             raise UnknownSystemException500()
-        session.flush()
+        await session.flush()
 
-        event_data = UserResponse.model_validate(self)
+        event_data = await session.run_sync(lambda _: UserResponse.model_validate(self))
         dispatch(UserEvent.USER_REMOVED, event_data)
         return event_data
 
-    def on_logged_in(self) -> Token:
-        session = object_session(self)
+    async def on_logged_in(self) -> Token:
+        session = async_object_session(self)
         if not session:
             raise UnknownSystemException500()
-        session.flush()
+        await session.flush()
 
-        dispatch(UserEvent.USER_LOGGED_IN, UserResponse.model_validate(self))
+        dispatch(UserEvent.USER_LOGGED_IN, await session.run_sync(lambda _: UserResponse.model_validate(self)))
         if self.token is None:
             raise UnknownSystemException500()
         return Token(
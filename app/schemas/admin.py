@@ -1,7 +1,7 @@
 from pydantic import AwareDatetime, Field, SecretStr
 
 from app.schemas.base import IdCreatedUpdatedDto, Pagination, Schema
-from app.types.base import AuthorityEnum
+from app.types.base import AuthorityEnum, LoginIdMatchEnum
 
 
 class AdminBase(Schema):
@@ -43,8 +43,13 @@ class AdminChangePassword(Schema):
 
 
 class AdminListRequest(Pagination):
+    filter_modifiers = ("login_id_match",)
+
     id: int | None = Field(None, description="ID(KEY)")
     login_id: str | None = Field(None, description="로그인 아이디")
+    login_id_match: LoginIdMatchEnum | None = Field(
+        None, description="로그인 아이디 검색 방식 (PREFIX: 앞부분 일치(기본), CONTAINS: 부분 일치, EXACT: 완전 일치)"
+    )
     name: str | None = Field(None, description="관리자 이름")
     use_flag: bool | None = Field(None, description="사용 여부")
     manager_flag: bool | None = Field(None, description="매니저 여부")
@@ -1,7 +1,9 @@
+from typing import ClassVar
+
 from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
 from pydantic.alias_generators import to_camel
 
-from app.types.base import AuthorityEnum, UserTypeEnum
+from app.types.base import AuthorityEnum, CountStrategyEnum, UserTypeEnum
 
 
 class Schema(BaseModel):
@@ -17,7 +19,9 @@ class ListResult[T](Schema):
     page: int
     page_size: int
     total: int
+    total_exact: bool = Field(True, description="total 이 이번 요청에서 정확히 집계된 값인지 여부")
     items: list[T]
+    next_cursor: str | None = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
 
 
 class AvailableFlag(Schema):
@@ -89,3 +93,27 @@ class Operator(Schema):
 class Pagination(Schema):
     page: int = Field(1, description="페이지", ge=1, le=10_000)
     page_size: int = Field(10, description="페이지 사이즈", ge=1, le=100)
+    cursor: str | None = Field(
+        None, description="이전 응답의 nextCursor (지정 시 page 대신 커서 이후 항목을 조회)", max_length=512
+    )
+    ordering: str | None = Field(
+        None,
+        description="정렬 필드 (앞에 - 를 붙이면 내림차순, 예: -createdAt). 목록마다 허용된 필드만 사용 가능",
+        max_length=50,
+    )
+    count_strategy: CountStrategyEnum = Field(
+        CountStrategyEnum.EXACT,
+        description="total 집계 방식 (EXACT: 매번 집계, CACHED: 짧은 TTL 캐시, ESTIMATED: 필터가 없을 때 실행 계획 기반 추정)",
+    )
+
+    # 다른 조건의 검색 방식만 정하는 필드 (예: login_id_match). 단독으로는 조회 조건이 아니다
+    filter_modifiers: ClassVar[tuple[str, ...]] = ()
+
+    @property
+    def filtered(self) -> bool:
+        """페이지네이션 외의 조회 조건이 하나라도 지정되었는지 여부"""
+        return any(
+            getattr(self, name) is not None
+            for name in type(self).model_fields
+            if name not in Pagination.model_fields and name not in self.filter_modifiers
+        )
@@ -20,4 +20,5 @@ class NoticeResponse(IdCreatedUpdatedDto, NoticeBase):
 class NoticeListRequest(Pagination):
     id: int | None = Field(None, description="ID(KEY)")
     title: str | None = Field(None, description="제목")
+    keyword: str | None = Field(None, description="검색어 (제목 + 내용)")
     use_flag: bool | None = Field(None, description="사용 여부")
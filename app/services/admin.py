@@ -1,13 +1,12 @@
 import jwt
 from fastapi.security.utils import get_authorization_scheme_param
 from sqlalchemy import select
-from sqlalchemy.orm import joinedload
 from sqlalchemy.sql.functions import count
 from structlog import get_logger
 
 from app.core.code import Code
 from app.core.exception import BadRequestException400, UnauthorizedException401
-from app.dependencies.database import transactional
+from app.dependencies.database import async_transactional
 from app.models.admin import Admin
 from app.schemas.admin import (
     AdminChangePassword,
@@ -18,22 +17,33 @@ from app.schemas.admin import (
     AdminUpdate,
 )
 from app.schemas.base import ListResult, Operator, Token
+from app.services.operator import attach_operators
+from app.utils.cache import single_flight
 from app.utils.jwt import (
     create_access_token,
     get_refresh_token_claims,
     is_validated_jwt,
     issued_refresh_token_in_10_seconds,
 )
-from app.utils.pagination import get_pagination_list
-from app.utils.password import verify_password
+from app.utils.pagination import SortRegistry, get_pagination_list
+from app.utils.password import verify_password_async
+from app.utils.search import get_login_id_condition
 
 log = get_logger()
 
+# 목록 정렬 필드 -> 컬럼 (각 정렬은 removed_flag 와 묶인 인덱스를 사용한다)
+sort_registry = SortRegistry(
+    {"id": Admin.id, "loginId": Admin.login_id, "createdAt": Admin.created_at},
+    default="-id",
+    tie_breaker=Admin.id,
+)
+
 
+@single_flight
 async def get_admins(
     request: AdminListRequest,
 ) -> ListResult[AdminResponse]:
-    with transactional(readonly=True) as session:
+    async with async_transactional(readonly=True) as session:
         initial_query = select(Admin).filter_by(removed_flag=False)
         count_query = select(count(Admin.id)).filter_by(removed_flag=False)
 
@@ -42,8 +52,9 @@ async def get_admins(
             count_query = count_query.filter_by(id=request.id)
 
         if request.login_id is not None:
-            initial_query = initial_query.filter(Admin.login_id.ilike(f"%{request.login_id}%"))
-            count_query = count_query.filter(Admin.login_id.ilike(f"%{request.login_id}%"))
+            condition = get_login_id_condition(Admin.login_id, request.login_id, request.login_id_match)
+            initial_query = initial_query.filter(condition)
+            count_query = count_query.filter(condition)
 
         if request.name is not None:
             initial_query = initial_query.filter(Admin.name.ilike(f"%{request.name}%"))
@@ -57,27 +68,28 @@ async def get_admins(
             initial_query = initial_query.filter_by(manager_flag=request.manager_flag)
             count_query = count_query.filter_by(manager_flag=request.manager_flag)
 
-        return get_pagination_list(
+        return await get_pagination_list(
             session=session,
             initial_query=initial_query,
             count_query=count_query,
             schema_cls=AdminResponse,
             page=request.page,
             page_size=request.page_size,
-            ordering="-id",
+            ordering=sort_registry.get(request.ordering),
+            cursor=request.cursor,
+            count_strategy=request.count_strategy,
+            filtered=request.filtered,
+            preload=attach_operators,
         )
 
 
+@single_flight
 async def get_admin(admin_id: int) -> AdminResponse:
-    with transactional(readonly=True) as session:
-        result = session.scalar(
-            select(Admin)
-            .options(joinedload(Admin.created_by), joinedload(Admin.updated_by))
-            .filter_by(id=admin_id)
-            .filter_by(removed_flag=False)
-        )
+    async with async_transactional(readonly=True) as session:
+        result = await session.scalar(select(Admin).filter_by(id=admin_id).filter_by(removed_flag=False))
         if result is None:
             raise BadRequestException400(Code.UNKNOWN_ADMIN)
+        await attach_operators(session, [result])
         return AdminResponse.model_validate(result)
 
 
@@ -85,13 +97,16 @@ async def create_admin(
     data: AdminCreate,
     operator_id: int,
 ) -> AdminResponse:
-    with transactional() as session:
-        if session.scalar(select(Admin).filter_by(login_id=data.login_id).filter_by(removed_flag=False)) is not None:
+    async with async_transactional() as session:
+        if (
+            await session.scalar(select(Admin).filter_by(login_id=data.login_id).filter_by(removed_flag=False))
+            is not None
+        ):
             raise BadRequestException400(Code.ALREADY_JOINED_ACCOUNT)
 
-        admin = Admin.new(data, operator_id)
+        admin = await Admin.new(data, operator_id)
         session.add(admin)
-        return admin.on_created()
+        return await admin.on_created()
 
 
 async def update_admin(
@@ -99,8 +114,8 @@ async def update_admin(
     data: AdminUpdate,
     operator: Operator,
 ) -> AdminResponse:
-    with transactional() as session:
-        admin = session.scalar(select(Admin).filter_by(id=admin_id))
+    async with async_transactional() as session:
+        admin = await session.scalar(select(Admin).filter_by(id=admin_id))
         if admin is None or admin.removed_flag:
             raise BadRequestException400(Code.UNKNOWN_ADMIN)
         if not admin.manager_flag and admin.id == operator.id:
@@ -108,7 +123,7 @@ async def update_admin(
         if admin.manager_flag != data.manager_flag and not operator.manager_flag:
             raise BadRequestException400(Code.UNKNOWN_AUTHORITY)
         if (
-            session.scalar(
+            await session.scalar(
                 select(Admin)
                 .filter_by(login_id=data.login_id)
                 .filter_by(removed_flag=False)
@@ -118,22 +133,22 @@ async def update_admin(
         ):
             raise BadRequestException400(Code.ALREADY_JOINED_ACCOUNT)
 
-        admin.update(data, operator.id)
-        return admin.on_updated()
+        await admin.update(data, operator.id)
+        return await admin.on_updated()
 
 
 async def remove_admin(
     admin_id: int,
     operator_id: int,
 ) -> None:
-    with transactional() as session:
-        admin = session.scalar(select(Admin).filter_by(id=admin_id))
+    async with async_transactional() as session:
+        admin = await session.scalar(select(Admin).filter_by(id=admin_id))
         if admin is None:
             raise BadRequestException400(Code.UNKNOWN_ADMIN)
         if admin.id == operator_id:
             raise BadRequestException400(Code.CANNOT_REMOVE_YOURSELF)
         admin.remove(operator_id)
-        admin.on_removed()
+        await admin.on_removed()
 
 
 async def change_password(
@@ -141,15 +156,15 @@ async def change_password(
     data: AdminChangePassword,
     operator: Operator,
 ) -> AdminResponse:
-    with transactional() as session:
-        admin = session.scalar(select(Admin).filter_by(id=admin_id))
+    async with async_transactional() as session:
+        admin = await session.scalar(select(Admin).filter_by(id=admin_id))
         if admin is None or admin.removed_flag:
             raise BadRequestException400(Code.UNKNOWN_ADMIN)
 
         if not admin.password:
             raise BadRequestException400(Code.UNKNOWN_ADMIN)
 
-        if not verify_password(data.old_password.get_secret_value(), admin.password):
+        if not await verify_password_async(data.old_password.get_secret_value(), admin.password):
             log.warning(
                 "Admin password change failed - invalid old password",
                 admin_id=admin_id,
@@ -161,36 +176,36 @@ async def change_password(
         if data.old_password.get_secret_value() == data.new_password.get_secret_value():
             raise BadRequestException400(Code.CHANGE_TO_SAME_PASSWORD)
 
-        admin.change_password(data.new_password.get_secret_value(), operator)
-        return admin.on_password_changed()
+        await admin.change_password(data.new_password.get_secret_value(), operator)
+        return await admin.on_password_changed()
 
 
 async def login_admin(
     data: AdminLogin,
 ) -> Token:
-    with transactional() as session:
-        admin = session.scalar(select(Admin).filter_by(login_id=data.login_id).filter_by(removed_flag=False))
+    async with async_transactional() as session:
+        admin = await session.scalar(select(Admin).filter_by(login_id=data.login_id).filter_by(removed_flag=False))
         if admin is None:
             raise BadRequestException400(Code.UNJOINED_ACCOUNT)
 
         if not admin.use_flag:
             raise BadRequestException400(Code.UNKNOWN_ADMIN)
 
-        if not verify_password(data.password.get_secret_value(), admin.password):
+        if not await verify_password_async(data.password.get_secret_value(), admin.password):
             log.warning("Admin login failed - invalid password", login_id=data.login_id, admin_id=admin.id)
             raise BadRequestException400(Code.INVALID_PASSWORD)
 
         admin.renew_token()
 
-        return admin.on_logged_in()
+        return await admin.on_logged_in()
 
 
 async def renew_token(authorization: str) -> Token:
-    with transactional() as session:
+    async with async_transactional() as session:
         try:
             _scheme, credentials = get_authorization_scheme_param(authorization)
             admin_id = get_refresh_token_claims(credentials).id
-            admin = session.scalar(select(Admin).filter_by(id=admin_id))
+            admin = await session.scalar(select(Admin).filter_by(id=admin_id))
 
             if admin is None or admin.removed_flag or admin.token is None or not is_validated_jwt(admin.token):
                 raise UnauthorizedException401()
@@ -213,16 +228,16 @@ async def renew_token(authorization: str) -> Token:
 
 
 async def logout(account_id: int):
-    with transactional() as session:
-        admin = session.scalar(select(Admin).filter_by(id=account_id))
+    async with async_transactional() as session:
+        admin = await session.scalar(select(Admin).filter_by(id=account_id))
         if admin is None:
             raise BadRequestException400(Code.UNKNOWN_ADMIN)
         admin.logout()
 
 
 async def check_login_id(login_id: str, admin_id: int | None) -> bool:
-    with transactional(readonly=True) as session:
+    async with async_transactional(readonly=True) as session:
         query = select(Admin).filter_by(login_id=login_id).filter_by(removed_flag=False)
         if admin_id:
             query = query.filter(Admin.id != admin_id)
-        return session.scalar(query) is None
+        return await session.scalar(query) is None
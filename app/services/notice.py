@@ -1,20 +1,73 @@
+from fastapi_events.handlers.local import local_handler
+from fastapi_events.typing import Event
+from orjson import OPT_SORT_KEYS, dumps
 from sqlalchemy import select
-from sqlalchemy.orm import joinedload
 from sqlalchemy.sql.functions import count
 
 from app.core.code import Code
+from app.core.config import get_settings
 from app.core.exception import BadRequestException400
-from app.dependencies.database import transactional
+from app.dependencies.database import async_transactional
+from app.events.admin import AdminEvent
+from app.events.notice import NoticeEvent
 from app.models.notice import Notice
 from app.schemas.base import ListResult
 from app.schemas.notice import NoticeCreate, NoticeListRequest, NoticeResponse
-from app.utils.pagination import get_pagination_list
+from app.services.operator import attach_operators
+from app.utils.cache import CacheBackend, LocalCacheBackend, single_flight
+from app.utils.etag import SerializedResult
+from app.utils.pagination import SortRegistry, get_pagination_list
+from app.utils.search import get_search_condition
 
+# 직렬화된 공지사항 목록/상세 응답 캐시
+notice_cache: CacheBackend = LocalCacheBackend(maxsize=get_settings().notice_cache_size)
 
-async def get_notices(
+# 목록 정렬 필드 -> 컬럼 (각 정렬은 removed_flag 와 묶인 인덱스를 사용한다)
+sort_registry = SortRegistry(
+    {"id": Notice.id, "createdAt": Notice.created_at},
+    default="-id",
+    tie_breaker=Notice.id,
+)
+
+
+def set_notice_cache_backend(backend: CacheBackend) -> None:
+    global notice_cache
+    notice_cache = backend
+
+
+def _get_list_cache_key(request: NoticeListRequest) -> str:
+    return "list:" + dumps(request.model_dump(mode="json"), option=OPT_SORT_KEYS).decode()
+
+
+@local_handler.register(event_name=NoticeEvent.NOTICE_CREATED)
+@local_handler.register(event_name=NoticeEvent.NOTICE_UPDATED)
+@local_handler.register(event_name=NoticeEvent.NOTICE_REMOVED)
+@local_handler.register(event_name=AdminEvent.ADMIN_UPDATED)
+async def clear_notice_cache(event: Event) -> None:
+    # 응답에 포함된 작성자(관리자) 이름이 바뀌는 경우도 함께 비운다
+    await notice_cache.clear()
+
+
+async def get_notices(request: NoticeListRequest) -> SerializedResult:
+    cached = await notice_cache.get(_get_list_cache_key(request))
+    if cached is not None:
+        return SerializedResult.from_bytes(cached)
+    return await _load_notices(request)
+
+
+@single_flight
+async def _load_notices(request: NoticeListRequest) -> SerializedResult:
+    # 조회 중에 캐시가 비워졌다면 이전 스냅샷을 다시 저장하지 않는다
+    generation = await notice_cache.get_generation()
+    result = SerializedResult.from_model(await _select_notices(request))
+    await notice_cache.set(_get_list_cache_key(request), result.to_bytes(), get_settings().notice_cache_ttl, generation)
+    return result
+
+
+async def _select_notices(
     request: NoticeListRequest,
 ) -> ListResult[NoticeResponse]:
-    with transactional(readonly=True) as session:
+    async with async_transactional(readonly=True) as session:
         initial_query = select(Notice).filter_by(removed_flag=False)
         count_query = select(count(Notice.id)).filter_by(removed_flag=False)
 
@@ -22,40 +75,58 @@ async def get_notices(
             initial_query = initial_query.filter_by(id=request.id)
             count_query = count_query.filter_by(id=request.id)
 
+        relevance = None
         if request.title is not None:
-            initial_query = initial_query.filter(Notice.title.ilike(f"%{request.title}%"))
-            count_query = count_query.filter(Notice.title.ilike(f"%{request.title}%"))
+            condition, relevance = get_search_condition(session, [Notice.title], request.title)
+            initial_query = initial_query.filter(condition)
+            count_query = count_query.filter(condition)
+
+        if request.keyword is not None:
+            condition, relevance = get_search_condition(session, [Notice.title, Notice.content], request.keyword)
+            initial_query = initial_query.filter(condition)
+            count_query = count_query.filter(condition)
 
         if request.use_flag is not None:
             initial_query = initial_query.filter_by(use_flag=request.use_flag)
             count_query = count_query.filter_by(use_flag=request.use_flag)
 
-        return get_pagination_list(
+        return await get_pagination_list(
             session=session,
             initial_query=initial_query,
             count_query=count_query,
             schema_cls=NoticeResponse,
             page=request.page,
             page_size=request.page_size,
-            ordering="-id",
+            ordering=sort_registry.get(request.ordering),
+            cursor=request.cursor,
+            count_strategy=request.count_strategy,
+            filtered=request.filtered,
+            preload=attach_operators,
+            relevance=relevance,
         )
 
 
-async def get_notice(notice_id: int) -> NoticeResponse:
-    with transactional(readonly=True) as session:
-        result = session.scalar(
-            select(Notice)
-            .options(
-                joinedload(Notice.created_by_admin),
-                joinedload(Notice.created_by_user),
-                joinedload(Notice.updated_by_admin),
-                joinedload(Notice.updated_by_user),
-            )
-            .filter_by(id=notice_id)
-            .filter_by(removed_flag=False)
-        )
+async def get_notice(notice_id: int) -> SerializedResult:
+    cached = await notice_cache.get(f"detail:{notice_id}")
+    if cached is not None:
+        return SerializedResult.from_bytes(cached)
+    return await _load_notice(notice_id)
+
+
+@single_flight
+async def _load_notice(notice_id: int) -> SerializedResult:
+    generation = await notice_cache.get_generation()
+    result = SerializedResult.from_model(await _select_notice(notice_id))
+    await notice_cache.set(f"detail:{notice_id}", result.to_bytes(), get_settings().notice_cache_ttl, generation)
+    return result
+
+
+async def _select_notice(notice_id: int) -> NoticeResponse:
+    async with async_transactional(readonly=True) as session:
+        result = await session.scalar(select(Notice).filter_by(id=notice_id).filter_by(removed_flag=False))
         if result is None:
             raise BadRequestException400(Code.UNKNOWN_NOTICE)
+        await attach_operators(session, [result])
         return NoticeResponse.model_validate(result)
 
 
@@ -63,10 +134,10 @@ async def create_notice(
     data: NoticeCreate,
     operator_id: int,
 ) -> NoticeResponse:
-    with transactional() as session:
+    async with async_transactional() as session:
         notice = Notice.new(data, operator_id)
         session.add(notice)
-        return notice.on_created()
+        return await notice.on_created()
 
 
 async def update_notice(
@@ -74,21 +145,21 @@ async def update_notice(
     data: NoticeCreate,
     operator_id: int,
 ) -> NoticeResponse:
-    with transactional() as session:
-        notice = session.scalar(select(Notice).filter_by(id=notice_id))
+    async with async_transactional() as session:
+        notice = await session.scalar(select(Notice).filter_by(id=notice_id))
         if notice is None:
             raise BadRequestException400(Code.UNKNOWN_NOTICE)
         notice.update(data, operator_id)
-        return notice.on_updated()
+        return await notice.on_updated()
 
 
 async def remove_notice(
     notice_id: int,
     operator_id: int,
 ) -> None:
-    with transactional() as session:
-        notice = session.scalar(select(Notice).filter_by(id=notice_id))
+    async with async_transactional() as session:
+        notice = await session.scalar(select(Notice).filter_by(id=notice_id))
         if notice is None:
             raise BadRequestException400(Code.UNKNOWN_NOTICE)
         notice.remove(operator_id)
-        notice.on_removed()
+        await notice.on_removed()
@@ -0,0 +1,89 @@
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from fastapi_events.handlers.local import local_handler
+from fastapi_events.typing import Event
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.events.admin import AdminEvent
+from app.events.user import UserEvent
+from app.models.admin import Admin
+from app.models.notice import Notice
+from app.models.user import User
+from app.schemas.base import UserSimpleDto
+from app.types.base import UserTypeEnum
+from app.utils.cache import TTLCache
+
+type OperatorKey = tuple[UserTypeEnum, int]
+
+operator_cache: TTLCache[OperatorKey, UserSimpleDto] = TTLCache(
+    maxsize=get_settings().operator_cache_size, ttl=get_settings().operator_cache_ttl
+)
+
+
+async def get_operators(
+    session: AsyncSession,
+    keys: Iterable[OperatorKey],
+) -> dict[OperatorKey, UserSimpleDto]:
+    """(유형, ID) 목록의 작업자를 캐시에서 찾고, 없는 것만 유형별 IN 쿼리 한 번씩으로 조회
+
+    조회하는 동안 evict 가 있었다면 조회 결과를 캐시에 저장하지 않는다. (이전 이름이 다시 저장되지 않도록)
+    """
+    generation = operator_cache.generation
+    operators: dict[OperatorKey, UserSimpleDto] = {}
+    ids_by_type: dict[UserTypeEnum, set[int]] = {}
+    for key in set(keys):
+        cached = operator_cache.get(key)
+        if cached is not None:
+            operators[key] = cached
+        else:
+            ids_by_type.setdefault(key[0], set()).add(key[1])
+
+    for operator_type, ids in ids_by_type.items():
+        entity = Admin if operator_type == UserTypeEnum.ADMIN else User
+        rows = await session.execute(
+            select(entity.id, entity.login_id, entity.name).filter(entity.id.in_(ids))  # type: ignore[attr-defined]
+        )
+        for row in rows:
+            operator = UserSimpleDto(id=row.id, type=operator_type, login_id=row.login_id, name=row.name)
+            operators[(operator_type, row.id)] = operator
+            operator_cache.set((operator_type, row.id), operator, generation=generation)
+    return operators
+
+
+async def attach_operators(session: AsyncSession, rows: Sequence[Admin | Notice | User]) -> None:
+    """목록 행의 생성자/수정자를 한 번에 조회해 각 행에 보관한다
+
+    ORM 관계(created_by_* / updated_by_*)는 건드리지 않고 set_resolved_operators 로 일반 속성에 담으므로,
+    이후 model_validate 에서 created_by/updated_by 를 읽어도 관계를 lazy load 하지 않는다.
+    """
+    operators = await get_operators(
+        session,
+        [(row.created_object_type, row.created_object_id) for row in rows]
+        + [(row.updated_object_type, row.updated_object_id) for row in rows],
+    )
+    for row in rows:
+        row.set_resolved_operators(
+            operators.get((row.created_object_type, row.created_object_id)),
+            operators.get((row.updated_object_type, row.updated_object_id)),
+        )
+
+
+def _get_payload_id(payload: Any) -> int:
+    return payload["id"] if isinstance(payload, dict) else payload.id
+
+
+@local_handler.register(event_name=AdminEvent.ADMIN_UPDATED)
+@local_handler.register(event_name=AdminEvent.ADMIN_REMOVED)
+async def evict_admin_operator(event: Event) -> None:
+    _event_name, payload = event
+    operator_cache.delete((UserTypeEnum.ADMIN, _get_payload_id(payload)))
+
+
+@local_handler.register(event_name=UserEvent.USER_UPDATED)
+@local_handler.register(event_name=UserEvent.USER_REMOVED)
+async def evict_user_operator(event: Event) -> None:
+    _event_name, payload = event
+    operator_cache.delete((UserTypeEnum.USER, _get_payload_id(payload)))
@@ -15,3 +15,15 @@ class AuthorityEnum(StrEnum):
 
     NOTICE_VIEW = "NOTICE_VIEW"
     NOTICE_EDIT = "NOTICE_EDIT"
+
+
+class CountStrategyEnum(StrEnum):
+    EXACT = "EXACT"
+    CACHED = "CACHED"
+    ESTIMATED = "ESTIMATED"
+
+
+class LoginIdMatchEnum(StrEnum):
+    PREFIX = "PREFIX"
+    CONTAINS = "CONTAINS"
+    EXACT = "EXACT"
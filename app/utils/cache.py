@@ -0,0 +1,153 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Hashable
+from functools import wraps
+from threading import Lock
+from typing import Any, Protocol
+
+from orjson import OPT_SORT_KEYS, dumps
+from pydantic import BaseModel
+
+
+class TTLCache[K: Hashable, V]:
+    """크기 제한이 있는 프로세스(워커) 단위 LRU 캐시
+
+    각 항목은 만료 시각(epoch seconds)을 가지며, 만료된 항목은 조회 시점에 제거된다.
+    sync dependency 는 스레드 풀에서 실행되므로 내부 상태는 lock 으로 보호한다.
+    delete/clear 때마다 generation 이 증가한다. DB 조회 전에 읽어 둔 generation 을 set 에 넘기면,
+    조회하는 동안 무효화가 있었던 경우 이전 값을 다시 저장하지 않는다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float | None = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._data: OrderedDict[K, tuple[V, float | None]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[key]
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: K, value: V, expires_at: float | None = None, generation: int | None = None) -> None:
+        if expires_at is None and self.ttl is not None:
+            expires_at = time.time() + self.ttl
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        with self._lock:
+            self.generation += 1
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+
+class CacheBackend(Protocol):
+    """직렬화된 값을 저장하는 캐시 저장소
+
+    기본은 LocalCacheBackend 이고, 여러 워커가 공유하는 저장소(Redis 등)도 같은 인터페이스로 구현해 교체할 수 있다.
+    clear 는 해당 backend 가 담당하는 namespace 만 비워야 한다.
+    clear 는 generation 을 증가시키고, set 에 generation 이 주어지면 현재 generation 과 같을 때만 저장해야 한다.
+    """
+
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def get_generation(self) -> int: ...
+
+    async def set(self, key: str, value: bytes, ttl: float, generation: int | None = None) -> None: ...
+
+    async def clear(self) -> None: ...
+
+
+class LocalCacheBackend:
+    """TTLCache 기반 프로세스(워커) 단위 CacheBackend"""
+
+    def __init__(self, maxsize: int) -> None:
+        self.cache: TTLCache[str, bytes] = TTLCache(maxsize=maxsize)
+
+    async def get(self, key: str) -> bytes | None:
+        return self.cache.get(key)
+
+    async def get_generation(self) -> int:
+        return self.cache.generation
+
+    async def set(self, key: str, value: bytes, ttl: float, generation: int | None = None) -> None:
+        self.cache.set(key, value, expires_at=time.time() + ttl, generation=generation)
+
+    async def clear(self) -> None:
+        self.cache.clear()
+
+
+class SingleFlight:
+    """같은 key 로 동시에 들어온 비동기 호출을 진행 중인 하나의 실행으로 합쳐 결과(또는 예외)를 공유
+
+    실행은 별도 task 로 돌기 때문에 먼저 호출한 요청이 취소되어도 나머지 호출자는 결과를 받는다.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do[V](self, key: Hashable, func: Callable[[], Coroutine[Any, Any, V]]) -> V:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
+
+
+def _to_hashable(value: Any) -> Hashable:
+    if isinstance(value, BaseModel):
+        return type(value).__qualname__, dumps(value.model_dump(mode="json"), option=OPT_SORT_KEYS)
+    return value
+
+
+def single_flight[**P, R](
+    func: Callable[P, Coroutine[Any, Any, R]],
+) -> Callable[P, Coroutine[Any, Any, R]]:
+    """동시에 같은 인자로 호출되면 한 번만 실행하고 결과를 공유하는 데코레이터 (워커 단위)"""
+    flight = SingleFlight()
+
+    @wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        key = (
+            tuple(_to_hashable(arg) for arg in args),
+            tuple(sorted((name, _to_hashable(value)) for name, value in kwargs.items())),
+        )
+        return await flight.do(key, lambda: func(*args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,96 @@
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from hashlib import blake2b
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app.core.exception import NotModifiedException304
+from app.schemas.base import ListResult
+
+
+def _get_etag(body: bytes) -> str:
+    return f'W/"{blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _get_last_modified(result: BaseModel) -> datetime | None:
+    """단건 응답의 Last-Modified: 응답에 포함된 일시 필드 중 가장 최근 값
+
+    updated_at 을 바꾸지 않고 갱신되는 latest_active_at 같은 필드도 응답 본문에 들어가므로 함께 본다.
+    목록 응답은 행이 삭제되거나 정렬 순서가 바뀌어도 최대 updated_at 이 그대로일 수 있어 Last-Modified 를 쓰지 않는다.
+    """
+    if isinstance(result, ListResult):
+        return None
+    return max((value for value in result.__dict__.values() if isinstance(value, datetime)), default=None)
+
+
+class SerializedResult:
+    """camelCase alias 로 한 번 직렬화된 응답 본문과 그 검증자(ETag, Last-Modified)
+
+    ETag 를 계산한 본문을 JSONBytesResponse 로 그대로 응답해, 같은 모델을 FastAPI 가 다시 직렬화하지 않게 한다.
+
+    캐시에는 to_bytes() 형태(검증자 2줄 + 본문)로 저장해, 캐시 적중 시 본문을 파싱하지 않고 그대로 응답한다.
+    """
+
+    __slots__ = ("body", "etag", "last_modified")
+
+    def __init__(self, body: bytes, etag: str, last_modified: datetime | None):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @classmethod
+    def from_model(cls, result: BaseModel) -> SerializedResult:
+        body = result.__pydantic_serializer__.to_json(result, by_alias=True)
+        return cls(body, _get_etag(body), _get_last_modified(result))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> SerializedResult:
+        # JSON 본문에는 줄바꿈이 escape 되어 들어가므로 앞의 두 줄만 검증자로 분리된다
+        etag, last_modified, body = data.split(b"\n", 2)
+        return cls(body, etag.decode(), datetime.fromisoformat(last_modified.decode()) if last_modified else None)
+
+    def to_bytes(self) -> bytes:
+        last_modified = self.last_modified.isoformat() if self.last_modified else ""
+        return b"\n".join((self.etag.encode(), last_modified.encode(), self.body))
+
+
+def _is_etag_matched(if_none_match: str, etag: str) -> bool:
+    # If-None-Match 는 weak 비교를 사용한다
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag.removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def _is_not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):  # fmt: skip
+        return False
+    if since.tzinfo is None:
+        return False
+    # HTTP-date 는 초 단위까지만 표현된다
+    return last_modified.replace(microsecond=0) <= since
+
+
+def check_not_modified(http_request: Request, response: Response, result: SerializedResult) -> None:
+    """응답에 ETag/Last-Modified 를 설정하고, 클라이언트가 가진 버전과 같으면 304 로 응답을 끊는다
+
+    If-None-Match 가 있으면 If-Modified-Since 는 무시한다. (RFC 9110)
+    Last-Modified 가 없는 응답(목록)은 If-Modified-Since 로 304 를 주지 않는다.
+    """
+    etag, last_modified = result.etag, result.last_modified
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    response.headers.update(headers)
+
+    if_none_match = http_request.headers.get("If-None-Match")
+    if if_none_match is not None:
+        if _is_etag_matched(if_none_match, etag):
+            raise NotModifiedException304(headers)
+        return
+
+    if_modified_since = http_request.headers.get("If-Modified-Since")
+    if if_modified_since and last_modified is not None and _is_not_modified_since(if_modified_since, last_modified):
+        raise NotModifiedException304(headers)
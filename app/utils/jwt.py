@@ -1,10 +1,13 @@
 from datetime import UTC, datetime, timedelta
+from hashlib import blake2b
 from typing import Any
 
 from jwt import DecodeError, InvalidTokenError, decode, encode
+from pydantic import ValidationError
 
 from app.core.config import get_settings
 from app.schemas.base import AccessTokenClaims, RefreshTokenClaims
+from app.utils.cache import TTLCache
 from app.utils.datetime_utils import utcnow
 
 settings = get_settings()
@@ -18,6 +21,9 @@ ACCESS_TOKEN_EXPIRE_TIME = timedelta(
 )
 REFRESH_TOKEN_EXPIRE_TIME = timedelta(minutes=30)
 
+# 검증이 끝난 access token 의 claims 를 토큰 digest 기준으로 보관 (exp 시각에 만료)
+access_token_cache: TTLCache[bytes, AccessTokenClaims] = TTLCache(maxsize=settings.access_token_cache_size)
+
 
 def create_access_token(data: AccessTokenClaims | Any) -> str:
     _dict = AccessTokenClaims.model_validate(data).model_dump(by_alias=True)
@@ -64,5 +70,28 @@ def get_access_token_claims(access_token: str) -> AccessTokenClaims:
     return AccessTokenClaims.model_validate(get_claims(access_token))
 
 
+def get_verified_access_token_claims(access_token: str | None) -> AccessTokenClaims | None:
+    """access token 검증과 claims 파싱을 한 번의 decode 로 처리합니다. 유효하지 않으면 None 을 반환합니다.
+
+    검증된 claims 는 워커 단위 LRU 캐시에 보관되어, 같은 토큰의 재요청은 decode 없이 캐시에서 반환됩니다.
+    """
+    if not access_token or not access_token.strip():
+        return None
+
+    token_digest = blake2b(access_token.encode(), digest_size=16).digest()
+    claims = access_token_cache.get(token_digest)
+    if claims is not None:
+        return claims
+
+    try:
+        payload = decode(access_token, SECRET_KEY, algorithms=[ALGORITHM], options={"require": ["exp"]})
+        claims = AccessTokenClaims.model_validate(payload)
+    except (DecodeError, InvalidTokenError, ValidationError):  # fmt: skip
+        return None
+
+    access_token_cache.set(token_digest, claims, expires_at=payload["exp"])
+    return claims
+
+
 def get_refresh_token_claims(refresh_token: str) -> RefreshTokenClaims:
     return RefreshTokenClaims.model_validate(get_claims(refresh_token))
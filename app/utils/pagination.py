@@ -1,34 +1,254 @@
-from pydantic.alias_generators import to_snake
-from sqlalchemy import Select, text
-from sqlalchemy.orm import Session
+import asyncio
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import datetime
+from typing import Any
 
+from orjson import JSONDecodeError, dumps, loads
+from sqlalchemy import ColumnElement, Select, and_, or_, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.code import Code
+from app.core.config import get_settings
+from app.core.exception import BadRequestException400
+from app.dependencies.database import async_db_manager
 from app.schemas.base import ListResult
+from app.types.base import CountStrategyEnum
+from app.utils.cache import TTLCache
+
+# 정규화된 count 쿼리(SQL + 파라미터) -> total
+count_cache: TTLCache[tuple, int] = TTLCache(maxsize=1024, ttl=get_settings().list_count_cache_ttl)
+
+
+class Ordering:
+    """검증된 정렬 기준. (컬럼, 내림차순 여부) 목록과 그로 만든 ORDER BY 절을 함께 가진다"""
+
+    __slots__ = ("clauses", "columns", "key")
+
+    def __init__(self, key: str, columns: tuple[tuple[InstrumentedAttribute[Any], bool], ...]) -> None:
+        self.key = key
+        self.columns = columns
+        self.clauses = tuple(column.desc() if desc else column.asc() for column, desc in columns)
+
+
+class SortRegistry:
+    """목록별로 허용된 정렬 필드(camelCase) -> 컬럼 매핑
+
+    각 정렬 필드에는 removed_flag 와 묶인 인덱스가 있어야 한다. 같은 값의 순서를 고정하도록 tie_breaker(id) 를
+    같은 방향으로 덧붙이며, Ordering 을 미리 만들어 재사용하므로 ORDER BY 절이 요청마다 같아 SQLAlchemy 의
+    compiled cache 가 적중한다.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, InstrumentedAttribute[Any]],
+        default: str,
+        tie_breaker: InstrumentedAttribute[Any],
+    ) -> None:
+        self._orderings: dict[str, Ordering] = {}
+        for name, column in fields.items():
+            for desc in (False, True):
+                key = f"-{name}" if desc else name
+                columns = ((column, desc),) if column is tie_breaker else ((column, desc), (tie_breaker, desc))
+                self._orderings[key] = Ordering(key, columns)
+        self.default = self._orderings[default]
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """허용된 정렬 문자열 목록 (예: "id", "-id", "createdAt", ...)"""
+        return tuple(self._orderings)
+
+    def get(self, ordering: str | None) -> Ordering:
+        """정렬 문자열(예: "-createdAt")을 Ordering 으로 변환. 허용되지 않은 정렬이면 400"""
+        if ordering is None:
+            return self.default
+        try:
+            return self._orderings[ordering]
+        except KeyError:
+            raise BadRequestException400(Code.INVALID_ORDERING) from None
+
+
+def encode_cursor(ordering: Ordering, values: list[Any]) -> str:
+    """마지막 행의 정렬 키 값을 불투명한 커서 문자열로 인코딩"""
+    payload = dumps({"o": ordering.key, "v": [v.isoformat() if isinstance(v, datetime) else v for v in values]})
+    return urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def _parse_cursor_value(column: InstrumentedAttribute[Any], value: Any) -> Any:
+    """커서 값을 컬럼 타입(python_type)의 값으로 변환. 타입이 맞지 않으면 400
+
+    datetime 은 ISO 문자열이어야 하고 timezone 정보가 있어야 한다. (TZDateTime 은 naive datetime 을 받지 않는다)
+    """
+    python_type = column.type.python_type
+    if python_type is datetime:
+        if not isinstance(value, str):
+            raise BadRequestException400(Code.INVALID_CURSOR)
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            raise BadRequestException400(Code.INVALID_CURSOR) from None
+        if value.tzinfo is None:
+            raise BadRequestException400(Code.INVALID_CURSOR)
+        return value
+    # bool 은 int 의 하위 클래스이므로 따로 막는다
+    if not isinstance(value, python_type) or (isinstance(value, bool) and python_type is not bool):
+        raise BadRequestException400(Code.INVALID_CURSOR)
+    return value
+
+
+def decode_cursor(cursor: str, ordering: Ordering) -> list[Any]:
+    """커서 문자열을 ordering 의 컬럼별 값으로 변환. 형식이나 값의 타입이 맞지 않으면 400"""
+    try:
+        payload = loads(urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (BinasciiError, JSONDecodeError, ValueError):  # fmt: skip
+        raise BadRequestException400(Code.INVALID_CURSOR) from None
+
+    if not isinstance(payload, dict) or payload.get("o") != ordering.key or not isinstance(payload.get("v"), list):
+        raise BadRequestException400(Code.INVALID_CURSOR)
+    if len(payload["v"]) != len(ordering.columns):
+        raise BadRequestException400(Code.INVALID_CURSOR)
+    return [
+        _parse_cursor_value(column, value)
+        for (column, _desc), value in zip(ordering.columns, payload["v"], strict=True)
+    ]
+
+
+def _keyset_condition(ordering: Ordering, values: list[Any]) -> ColumnElement[bool]:
+    """(c1, c2, ...) 정렬 기준으로 커서 이후의 행만 남기는 조건
 
+    c1 > v1 OR (c1 = v1 AND c2 > v2) OR ... 형태로 전개하며, 내림차순 컬럼은 < 로 비교한다.
+    """
+    columns = ordering.columns
+    conditions = []
+    for index, (column, desc) in enumerate(columns):
+        equals = [
+            prev_column == prev_value for (prev_column, _), prev_value in zip(columns[:index], values, strict=False)
+        ]
+        beyond = column < values[index] if desc else column > values[index]
+        conditions.append(and_(*equals, beyond))
+    return or_(*conditions)
 
-def get_pagination_list(
+
+def _count_cache_key(count_query: Select) -> tuple:
+    compiled = count_query.compile()
+    return str(compiled), tuple(sorted(compiled.params.items()))
+
+
+async def _estimate_count(session: AsyncSession, count_query: Select) -> int | None:
+    """MySQL 실행 계획의 예상 행 수로 total 을 추정 (MySQL 이 아니면 None)"""
+    dialect = session.bind.dialect
+    if dialect.name != "mysql":
+        return None
+    statement = count_query.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    plan = (await session.execute(text(f"EXPLAIN {statement}"))).mappings().first()
+    if not plan or plan.get("rows") is None:
+        return None
+    return int(plan["rows"])
+
+
+async def get_total_count(
+    session: AsyncSession,
+    count_query: Select,
+    count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT,
+    filtered: bool = True,
+) -> tuple[int, bool]:
+    """count_strategy 에 따라 total 을 구한다. (total, 이번 요청에서 정확히 집계했는지 여부) 를 반환
+
+    ESTIMATED 는 필터가 없는 목록에만 적용되고, 필터가 있으면 CACHED 로 처리한다.
+    """
+    if count_strategy == CountStrategyEnum.ESTIMATED and not filtered:
+        estimated = await _estimate_count(session, count_query)
+        if estimated is not None:
+            return estimated, False
+
+    if count_strategy == CountStrategyEnum.EXACT:
+        return await session.scalar(count_query) or 0, True
+
+    cache_key = _count_cache_key(count_query)
+    total = count_cache.get(cache_key)
+    if total is not None:
+        return total, False
+
+    total = await session.scalar(count_query) or 0
+    count_cache.set(cache_key, total)
+    return total, True
+
+
+async def _get_total_count_on_count_session(
+    count_query: Select, count_strategy: CountStrategyEnum, filtered: bool
+) -> tuple[int, bool]:
+    """목록 조회와 별도의 count 전용 커넥션 풀에서 total 을 집계"""
+    async with async_db_manager.count_session() as count_session:
+        return await get_total_count(count_session, count_query, count_strategy, filtered)
+
+
+async def get_pagination_list(
     schema_cls,
-    session: Session,
+    session: AsyncSession,
     page: int,
     page_size: int,
     initial_query: Select,
     count_query: Select,
-    ordering: str | None = None,
+    ordering: Ordering | None = None,
+    cursor: str | None = None,
+    count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT,
+    filtered: bool = True,
+    preload: Callable[[AsyncSession, Sequence[Any]], Awaitable[None]] | None = None,
+    relevance: ColumnElement | None = None,
 ) -> ListResult:
+    """목록 조회
+
+    ordering 은 SortRegistry 로 검증된 정렬 기준이며, cursor 가 주어지면 OFFSET 대신 커서 이후의 행을 정렬 인덱스로 바로 찾는 keyset 방식으로 조회한다.
+    응답의 next_cursor 는 다음 페이지가 있을 때만 채워지고, total 은 count_strategy 에 따라 집계된다.
+    list_concurrent_count 설정이 켜져 있으면 count 쿼리는 count 전용 커넥션 풀에서 목록 쿼리와 동시에 실행된다.
+    preload 는 조회된 행 전체를 받아 schema 변환 전에 연관 데이터를 일괄로 채우는 데 사용한다.
+    relevance 가 주어지면 검색 관련도 순으로 먼저 정렬하며, 이 때는 커서 방식을 사용할 수 없다.
+    """
     query = initial_query
 
-    if ordering:
-        order_clauses = []
-        for ordering_condition in ordering.split(","):
-            if ordering_condition.startswith("-"):
-                column_name = to_snake(ordering_condition[1:])
-                order_clauses.append(text(f"{column_name} DESC"))
-            else:
-                column_name = to_snake(ordering_condition)
-                order_clauses.append(text(f"{column_name} ASC"))
-        query = query.order_by(*order_clauses)
-
-    results = session.scalars(query.limit(page_size).offset((page - 1) * page_size)).all()
+    if relevance is not None:
+        if cursor:
+            raise BadRequestException400(Code.INVALID_CURSOR)
+        query = query.order_by(relevance.desc())
+
+    if ordering is not None:
+        query = query.order_by(*ordering.clauses)
+
+    if cursor and ordering is not None:
+        query = query.filter(_keyset_condition(ordering, decode_cursor(cursor, ordering)))
+    else:
+        query = query.offset((page - 1) * page_size)
+
+    if get_settings().list_concurrent_count:
+        scalar_result, (total, total_exact) = await asyncio.gather(
+            session.scalars(query.limit(page_size + 1)),
+            _get_total_count_on_count_session(count_query, count_strategy, filtered),
+        )
+    else:
+        scalar_result = await session.scalars(query.limit(page_size + 1))
+        total, total_exact = await get_total_count(session, count_query, count_strategy, filtered)
+
+    results = scalar_result.all()
+    has_next = len(results) > page_size
+    results = results[:page_size]
+
+    next_cursor = None
+    if has_next and ordering is not None and relevance is None:
+        last = results[-1]
+        next_cursor = encode_cursor(ordering, [getattr(last, column.key) for column, _ in ordering.columns])
+
+    if preload is not None and results:
+        await preload(session, results)
+
     obj_data_list = [schema_cls.model_validate(model_obj) for model_obj in results]
-    total_obj = session.scalar(count_query)
 
-    return ListResult[schema_cls](items=obj_data_list, total=total_obj or 0, page=page, page_size=page_size)
+    return ListResult[schema_cls](
+        items=obj_data_list,
+        total=total,
+        total_exact=total_exact,
+        page=page,
+        page_size=page_size,
+        next_cursor=next_cursor,
+    )
@@ -1,5 +1,11 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
+from app.core.config import get_settings
+
 
 def _truncate_password_to_72_bytes(password: str) -> bytes:
     """bcrypt의 72바이트 제한에 맞게 비밀번호를 안전하게 자름.
@@ -47,3 +53,55 @@ def get_password_hash(password: str) -> str:
     password_bytes = _truncate_password_to_72_bytes(password)
     hashed = bcrypt.hashpw(password_bytes, bcrypt.gensalt())
     return hashed.decode("utf-8")
+
+
+class PasswordHashExecutor:
+    """bcrypt 연산을 이벤트 루프 밖에서 실행하기 위한 전용 스레드 풀
+
+    bcrypt 는 해싱 중 GIL 을 해제하므로 프로세스 풀 없이도 병렬로 실행됩니다.
+    동시 실행 수는 max_workers 로 제한되고, 초과 요청은 풀의 대기열에서 기다립니다.
+    close() 는 lifespan 종료 시(Lambda 제외) 호출되며, 이후에 다시 호출되면 스레드 풀을 새로 만듭니다.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self.in_flight = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password_hash_")
+        return self._executor
+
+    async def run[T](self, func: Callable[..., T], *args) -> T:
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        try:
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.in_flight -= 1
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self.in_flight - self.max_workers, 0)
+
+    def to_log_fields(self) -> dict[str, int]:
+        return {"password_hash_in_flight": self.in_flight, "password_hash_queue_depth": self.queue_depth}
+
+    def close(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+password_hash_executor = PasswordHashExecutor(max_workers=get_settings().password_hash_max_workers)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str | None) -> bool:
+    """verify_password 를 전용 스레드 풀에서 실행"""
+    return await password_hash_executor.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash 를 전용 스레드 풀에서 실행"""
+    return await password_hash_executor.run(get_password_hash, password)
@@ -0,0 +1,45 @@
+from sqlalchemy import ColumnElement, or_
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.config import get_settings
+from app.types.base import LoginIdMatchEnum
+
+
+def get_search_condition(
+    session: AsyncSession,
+    columns: list[InstrumentedAttribute[str]],
+    term: str,
+) -> tuple[ColumnElement[bool], ColumnElement | None]:
+    """검색어 조건과 관련도(정렬용) 식을 반환
+
+    MySQL 에서는 ngram FULLTEXT 인덱스(migrations/V4)를 타는 MATCH ... AGAINST 구문 검색을 사용하고,
+    ngram 토큰보다 짧은 검색어이거나 MySQL 이 아니면 ILIKE 로 대체한다. (이 경우 관련도는 None)
+    columns 는 FULLTEXT 인덱스의 컬럼 구성과 정확히 같아야 한다.
+    """
+    if len(term) < get_settings().fulltext_min_term_length or session.bind.dialect.name != "mysql":
+        return or_(*(column.ilike(f"%{term}%") for column in columns)), None
+
+    # 큰따옴표로 감싼 구문 검색은 ILIKE 의 연속 부분 일치와 같은 의미가 된다
+    phrase = '"' + term.replace('"', " ") + '"'
+    relevance = match(*(column.expression for column in columns), against=phrase).in_boolean_mode()
+    return relevance, relevance
+
+
+def get_login_id_condition(
+    column: InstrumentedAttribute[str],
+    term: str,
+    login_id_match: LoginIdMatchEnum | None,
+) -> ColumnElement[bool]:
+    """login_id 검색 조건 (기본 PREFIX)
+
+    PREFIX 는 상수 패턴 LIKE 'x%' 로 만들어 login_id 인덱스의 range scan 을 탈 수 있게 한다.
+    컬럼 collation 이 대소문자를 구분하지 않으므로 lower() 를 씌우지 않는다.
+    """
+    if login_id_match == LoginIdMatchEnum.EXACT:
+        return column == term
+    if login_id_match == LoginIdMatchEnum.CONTAINS:
+        return column.ilike(f"%{term}%")
+    escaped = term.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    return column.like(f"{escaped}%", escape="/")
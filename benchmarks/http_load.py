@@ -0,0 +1,534 @@
+"""HTTP 부하 벤치마크
+
+전용 데이터베이스(<DB_NAME>_benchmark)에 migrations/ 스키마와 데이터를 채운 뒤, app.main:app 에 시나리오(mix)별 요청을
+가상 사용자 수만큼 동시에 보내고 라우트별 처리량과 p50/p95/p99 지연 시간을 출력/저장한다.
+
+    DEPLOYMENT_ENVIRONMENT=local python -m benchmarks.http_load --target asgi uvicorn hypercorn --mix read mixed
+
+- asgi: 같은 프로세스에서 ASGI 앱을 직접 호출 (서버/네트워크 비용 제외)
+- uvicorn, hypercorn: 로컬 포트에 실제 서버를 띄우고 가상 사용자마다 HTTP/1.1 keep-alive 연결 하나로 호출
+
+결과는 benchmarks/results/http_load-<commit>.json 으로 저장되며, --baseline 으로 이전 커밋의 결과와 비교할 수 있다.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from math import ceil
+from pathlib import Path
+from typing import Any, Protocol
+
+from orjson import OPT_INDENT_2, dumps, loads
+
+from benchmarks.seed import PACKAGE_ROOT, connect, get_commit, load_schema, use_database
+
+RESULTS_PATH = PACKAGE_ROOT / "benchmarks" / "results"
+BENCHMARK_PASSWORD = "benchmark-password-1!"
+
+
+class Client(Protocol):
+    async def request(
+        self, method: str, path: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, dict[str, str], bytes]: ...
+
+    async def close(self) -> None: ...
+
+
+class AsgiClient:
+    """같은 프로세스에서 ASGI 앱을 직접 호출"""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def request(
+        self, method: str, path: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, dict[str, str], bytes]:
+        path, _, query = path.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+            "client": ("127.0.0.1", 50000),
+            "server": ("127.0.0.1", 80),
+        }
+        request_sent = False
+        response_complete = asyncio.Event()
+        status = 0
+        response_headers: dict[str, str] = {}
+        chunks: list[bytes] = []
+
+        async def receive() -> dict[str, Any]:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            # 본문을 모두 보낸 뒤에는 응답이 끝날 때까지 연결이 유지된 것처럼 기다린다
+            await response_complete.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers.update((name.decode(), value.decode()) for name, value in message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    response_complete.set()
+
+        await self.app(scope, receive, send)
+        response_complete.set()
+        return status, response_headers, b"".join(chunks)
+
+    async def close(self) -> None:
+        pass
+
+
+class HttpClient:
+    """HTTP/1.1 keep-alive 연결 하나 (가상 사용자마다 하나씩 사용)"""
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def request(
+        self, method: str, path: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, dict[str, str], bytes]:
+        try:
+            return await self._request(method, path, headers, body)
+        except (ConnectionError, asyncio.IncompleteReadError):  # fmt: skip
+            # 서버가 keep-alive 연결을 먼저 닫은 경우 한 번만 다시 연결한다
+            await self.close()
+            return await self._request(method, path, headers, body)
+
+    async def _request(
+        self, method: str, path: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, dict[str, str], bytes]:
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        assert self._reader is not None
+
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}", f"Content-Length: {len(body)}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        self._writer.write("\r\n".join(lines).encode() + b"\r\n\r\n" + body)
+        await self._writer.drain()
+
+        status_line = await self._reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed by server")
+        status = int(status_line.split()[1])
+        response_headers: dict[str, str] = {}
+        while (line := await self._reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding") == "chunked":
+            response_body = await self._read_chunked()
+        else:
+            response_body = await self._reader.readexactly(int(response_headers.get("content-length", 0)))
+
+        if response_headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, response_headers, response_body
+
+    async def _read_chunked(self) -> bytes:
+        assert self._reader is not None
+        chunks = []
+        while size := int((await self._reader.readline()).split(b";")[0], 16):
+            chunks.append(await self._reader.readexactly(size))
+            await self._reader.readline()
+        await self._reader.readline()
+        return b"".join(chunks)
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._reader = None
+
+
+class Recorder:
+    """라우트별 지연 시간(초)과 오류 수. measure_from 이전(워밍업)에 시작한 요청은 버린다"""
+
+    def __init__(self) -> None:
+        self.measure_from = float("inf")
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, int] = {}
+
+    def record(self, route: str, started: float, elapsed: float, status: int) -> None:
+        if started < self.measure_from:
+            return
+        self.latencies.setdefault(route, []).append(elapsed)
+        if status >= 400:
+            self.errors[route] = self.errors.get(route, 0) + 1
+
+
+@dataclass
+class Fixture:
+    admin_ids: list[int]
+    user_ids: list[int]
+    notice_ids: list[int]
+
+
+@dataclass
+class VirtualUser:
+    index: int
+    client: Client
+    fixture: Fixture
+    recorder: Recorder
+    rng: random.Random
+    tokens: dict[str, tuple[str, str]] = field(default_factory=dict)
+
+    @property
+    def login_id(self) -> str:
+        return f"seed{self.index + 1}"
+
+    async def call(
+        self, route: str, method: str, path: str, token: str | None = None, json: Any = None
+    ) -> tuple[int, bytes]:
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        body = b""
+        if json is not None:
+            headers["Content-Type"] = "application/json"
+            body = dumps(json)
+        started = time.perf_counter()
+        status, _headers, response_body = await self.client.request(method, f"/api{path}", headers, body)
+        self.recorder.record(route, started, time.perf_counter() - started, status)
+        return status, response_body
+
+    @property
+    def admin_token(self) -> str:
+        return self.tokens["admins"][0]
+
+    async def login(self, kind: str) -> None:
+        status, body = await self.call(
+            f"POST /v1/{kind}/login",
+            "POST",
+            f"/v1/{kind}/login",
+            json={"loginId": self.login_id, "password": BENCHMARK_PASSWORD},
+        )
+        if status == 200:
+            token = loads(body)
+            self.tokens[kind] = (token["accessToken"], token["refreshToken"])
+
+    async def renew_token(self, kind: str) -> None:
+        status, body = await self.call(
+            f"GET /v1/{kind}/renew-token", "GET", f"/v1/{kind}/renew-token", token=self.tokens[kind][1]
+        )
+        if status == 200:
+            token = loads(body)
+            self.tokens[kind] = (token["accessToken"], token["refreshToken"])
+
+
+def _notice_payload(vu: VirtualUser) -> dict[str, Any]:
+    return {"title": f"벤치마크 공지 {vu.rng.randrange(1_000_000)}", "content": "벤치마크 본문", "useFlag": True}
+
+
+OPERATIONS: dict[str, Callable[[VirtualUser], Awaitable[Any]]] = {
+    "admin_login": lambda vu: vu.login("admins"),
+    "admin_renew_token": lambda vu: vu.renew_token("admins"),
+    "user_login": lambda vu: vu.login("users"),
+    "user_renew_token": lambda vu: vu.renew_token("users"),
+    "notice_list": lambda vu: vu.call(
+        "GET /v1/notices", "GET", f"/v1/notices?page={vu.rng.randint(1, 5)}&pageSize=10", token=vu.admin_token
+    ),
+    "notice_detail": lambda vu: vu.call(
+        "GET /v1/notices/{id}", "GET", f"/v1/notices/{vu.rng.choice(vu.fixture.notice_ids)}", token=vu.admin_token
+    ),
+    "admin_list": lambda vu: vu.call(
+        "GET /v1/admins", "GET", f"/v1/admins?page={vu.rng.randint(1, 5)}&pageSize=10", token=vu.admin_token
+    ),
+    "admin_detail": lambda vu: vu.call(
+        "GET /v1/admins/{id}", "GET", f"/v1/admins/{vu.rng.choice(vu.fixture.admin_ids)}", token=vu.admin_token
+    ),
+    "user_list": lambda vu: vu.call(
+        "GET /v1/users", "GET", f"/v1/users?page={vu.rng.randint(1, 5)}&pageSize=10", token=vu.admin_token
+    ),
+    "user_detail": lambda vu: vu.call(
+        "GET /v1/users/{id}", "GET", f"/v1/users/{vu.rng.choice(vu.fixture.user_ids)}", token=vu.admin_token
+    ),
+    "notice_create": lambda vu: vu.call(
+        "POST /v1/notices", "POST", "/v1/notices", token=vu.admin_token, json=_notice_payload(vu)
+    ),
+    "notice_update": lambda vu: vu.call(
+        "PUT /v1/notices/{id}",
+        "PUT",
+        f"/v1/notices/{vu.rng.choice(vu.fixture.notice_ids)}",
+        token=vu.admin_token,
+        json=_notice_payload(vu),
+    ),
+}
+
+_READ_MIX = {
+    "notice_list": 30,
+    "notice_detail": 30,
+    "admin_list": 10,
+    "admin_detail": 10,
+    "user_list": 10,
+    "user_detail": 10,
+}
+
+# 시나리오별 작업 가중치
+MIXES: dict[str, dict[str, int]] = {
+    "read": _READ_MIX,
+    "mixed": {
+        **_READ_MIX,
+        "notice_create": 5,
+        "notice_update": 5,
+        "admin_login": 1,
+        "admin_renew_token": 2,
+        "user_login": 1,
+        "user_renew_token": 2,
+    },
+    "write": {"notice_create": 50, "notice_update": 50},
+    "auth": {"admin_login": 25, "admin_renew_token": 25, "user_login": 25, "user_renew_token": 25},
+}
+
+
+def prepare_fixture(database: str, rows: int, accounts: int, skip_seed: bool) -> Fixture:
+    """데이터를 채우고, 가상 사용자가 로그인할 관리자/유저 계정(seed1 ~ seed<accounts>)의 비밀번호와 권한을 맞춘다"""
+    from app.models.admin import Admin
+    from app.models.notice import Notice
+    from app.models.user import User
+    from app.utils.password import get_password_hash
+
+    if not skip_seed:
+        load_schema(database, rows)
+
+    password = get_password_hash(BENCHMARK_PASSWORD)
+    login_ids = [f"seed{index + 1}" for index in range(accounts)]
+    with connect(database) as connection, connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE `{Admin.__tablename__}` SET password = %s, use_flag = 1, manager_flag = 1, removed_flag = 0 "
+            "WHERE login_id IN %s",
+            (password, login_ids),
+        )
+        cursor.execute(
+            f"UPDATE `{User.__tablename__}` SET password = %s, use_flag = 1, removed_flag = 0 WHERE login_id IN %s",
+            (password, login_ids),
+        )
+
+        def select_ids(table_name: str) -> list[int]:
+            cursor.execute(f"SELECT id FROM `{table_name}` WHERE removed_flag = 0 ORDER BY id LIMIT 1000")
+            return [row[0] for row in cursor.fetchall()]
+
+        return Fixture(
+            admin_ids=select_ids(Admin.__tablename__),
+            user_ids=select_ids(User.__tablename__),
+            notice_ids=select_ids(Notice.__tablename__),
+        )
+
+
+async def _run_virtual_user(vu: VirtualUser, mix: dict[str, int], deadline: float) -> None:
+    operations = [OPERATIONS[name] for name in mix]
+    weights = list(mix.values())
+    while time.perf_counter() < deadline:
+        await vu.rng.choices(operations, weights)[0](vu)
+
+
+async def run_load(
+    client_factory: Callable[[], Client],
+    fixture: Fixture,
+    mix: dict[str, int],
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    seed: int,
+) -> Recorder:
+    """가상 사용자마다 관리자/유저로 로그인한 뒤(측정 제외) warmup + duration 동안 mix 의 작업을 반복"""
+    recorder = Recorder()
+    users = [
+        VirtualUser(index, client_factory(), fixture, recorder, random.Random(seed + index))
+        for index in range(concurrency)
+    ]
+    try:
+        for kind in ("admins", "users"):
+            await asyncio.gather(*(vu.login(kind) for vu in users))
+        recorder.measure_from = time.perf_counter() + warmup
+        deadline = recorder.measure_from + duration
+        await asyncio.gather(*(_run_virtual_user(vu, mix, deadline) for vu in users))
+    finally:
+        for vu in users:
+            await vu.client.close()
+    return recorder
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """nearest-rank 백분위수 (values 는 정렬되어 있어야 한다)"""
+    return values[max(ceil(len(values) * percent / 100) - 1, 0)]
+
+
+def _summarize(latencies: list[float], errors: int, duration: float) -> dict[str, Any]:
+    values = sorted(latency * 1000 for latency in latencies)
+    return {
+        "count": len(values),
+        "errors": errors,
+        "rps": round(len(values) / duration, 2),
+        "mean_ms": round(sum(values) / len(values), 3),
+        "p50_ms": round(_percentile(values, 50), 3),
+        "p95_ms": round(_percentile(values, 95), 3),
+        "p99_ms": round(_percentile(values, 99), 3),
+        "max_ms": round(values[-1], 3),
+    }
+
+
+def summarize(recorder: Recorder, duration: float) -> dict[str, Any]:
+    routes = {
+        route: _summarize(latencies, recorder.errors.get(route, 0), duration)
+        for route, latencies in sorted(recorder.latencies.items())
+    }
+    all_latencies = [latency for latencies in recorder.latencies.values() for latency in latencies]
+    total = _summarize(all_latencies, sum(recorder.errors.values()), duration) if all_latencies else {}
+    return {"total": total, "routes": routes}
+
+
+@asynccontextmanager
+async def serve(target: str, port: int, workers: int) -> AsyncIterator[Callable[[], Client]]:
+    """target 에 맞는 클라이언트 팩토리를 제공. uvicorn/hypercorn 은 하위 프로세스로 서버를 띄운다"""
+    if target == "asgi":
+        from app.main import app
+
+        assert app is not None
+        async with app.router.lifespan_context(app):
+            client = AsgiClient(app)
+            yield lambda: client
+        return
+
+    bind = ["--host", "127.0.0.1", "--port", str(port)] if target == "uvicorn" else ["--bind", f"127.0.0.1:{port}"]
+    command = [sys.executable, "-m", target, "app.main:app", *bind, "--workers", str(workers), "--log-level", "warning"]
+    if target == "uvicorn":
+        command.append("--no-access-log")
+    process = await asyncio.create_subprocess_exec(*command, cwd=PACKAGE_ROOT, env=os.environ.copy())
+    try:
+        await _wait_until_ready(port)
+        yield lambda: HttpClient("127.0.0.1", port)
+    finally:
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=30)
+        except TimeoutError:
+            process.kill()
+
+
+async def _wait_until_ready(port: int, timeout: float = 30) -> None:
+    deadline = time.perf_counter() + timeout
+    while True:
+        client = HttpClient("127.0.0.1", port)
+        try:
+            status, _headers, _body = await client.request("GET", "/health/liveness", {}, b"")
+            if status == 200:
+                return
+        except OSError:
+            pass
+        finally:
+            await client.close()
+        if time.perf_counter() > deadline:
+            raise TimeoutError(f"server on port {port} did not become ready in {timeout}s")
+        await asyncio.sleep(0.2)
+
+
+def _format_change(current: float, baseline: float | None) -> str:
+    if not baseline:
+        return ""
+    return f" ({(current - baseline) / baseline * 100:+.1f}%)"
+
+
+def print_run(run: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    print(f"\n[{run['target']} / {run['mix']}] concurrency={run['concurrency']} duration={run['duration']}s")
+    print(f"{'route':<28}{'count':>8}{'errors':>8}{'rps':>20}{'p50':>12}{'p95':>22}{'p99':>12}")
+    rows = [*run["routes"].items(), ("TOTAL", run["total"])]
+    baseline_routes = {**(baseline or {}).get("routes", {}), "TOTAL": (baseline or {}).get("total", {})}
+    for route, stats in rows:
+        if not stats:
+            continue
+        base = baseline_routes.get(route, {})
+        print(
+            f"{route:<28}{stats['count']:>8}{stats['errors']:>8}"
+            f"{stats['rps']:>10.1f}{_format_change(stats['rps'], base.get('rps')):>10}"
+            f"{stats['p50_ms']:>10.2f}ms"
+            f"{stats['p95_ms']:>10.2f}ms{_format_change(stats['p95_ms'], base.get('p95_ms')):>10}"
+            f"{stats['p99_ms']:>10.2f}ms"
+        )
+
+
+async def run(args: argparse.Namespace, fixture: Fixture) -> list[dict[str, Any]]:
+    runs = []
+    for target in args.target:
+        async with serve(target, args.port, args.workers) as client_factory:
+            for mix_name in args.mix:
+                recorder = await run_load(
+                    client_factory, fixture, MIXES[mix_name], args.concurrency, args.duration, args.warmup, args.seed
+                )
+                runs.append(
+                    {
+                        "target": target,
+                        "mix": mix_name,
+                        "concurrency": args.concurrency,
+                        "duration": args.duration,
+                        **summarize(recorder, args.duration),
+                    }
+                )
+    return runs
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", nargs="+", choices=["asgi", "uvicorn", "hypercorn"], default=["asgi"])
+    parser.add_argument("--mix", nargs="+", choices=list(MIXES), default=["mixed"])
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=30, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=5, help="측정 전 워밍업 시간(초)")
+    parser.add_argument("--rows", type=int, default=20_000, help="테이블별로 채울 행 수")
+    parser.add_argument("--skip-seed", action="store_true", help="이미 채워진 전용 데이터베이스를 그대로 사용")
+    parser.add_argument("--port", type=int, default=18000)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn/hypercorn 워커 수")
+    parser.add_argument("--seed", type=int, default=0, help="요청 순서를 정하는 난수 시드")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본: benchmarks/results/http_load-<commit>.json)")
+    parser.add_argument("--baseline", type=Path, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    # 요청마다 남는 access log 가 측정값에 섞이지 않도록 느린 요청만 남긴다
+    os.environ.setdefault("ACCESS_LOG_SAMPLE_RATE", "0")
+    database = use_database("benchmark")
+    fixture = prepare_fixture(database, args.rows, args.concurrency, args.skip_seed)
+    runs = asyncio.run(run(args, fixture))
+
+    baseline_runs = {}
+    if args.baseline:
+        baseline_runs = {(r["target"], r["mix"]): r for r in loads(args.baseline.read_bytes())["runs"]}
+    for result in runs:
+        print_run(result, baseline_runs.get((result["target"], result["mix"])))
+
+    commit = get_commit()
+    output = args.output or RESULTS_PATH / f"http_load-{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    meta = {
+        "commit": commit,
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": sys.version.split()[0],
+        "rows": args.rows,
+        "workers": args.workers,
+    }
+    output.write_bytes(dumps({"meta": meta, "runs": runs}, option=OPT_INDENT_2))
+    print(f"\nsaved: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,271 @@
+"""인증/비밀번호/ORM 타입/직렬화 경로 마이크로 벤치마크
+
+    DEPLOYMENT_ENVIRONMENT=test python -m benchmarks.micro [--filter jwt] [--baseline benchmarks/results/micro-<commit>.json]
+
+pyperf 와 같은 방식으로 측정한다. 벤치마크마다 --processes 개의 하위 프로세스를 띄우고, 각 프로세스는 값 하나의 측정이
+--min-time 이상 걸리도록 반복 횟수(loops)를 보정한 뒤 워밍업 값을 버리고 --values 개의 값을 모은다.
+모든 값으로 평균 ± 표준편차와 중앙값을 출력하며, 결과는 benchmarks/results/micro-<commit>.json 으로 저장된다.
+--baseline 과 비교할 때는 차이가 유의한지(Welch t 통계량의 절댓값 > 2)도 함께 표시한다.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from math import sqrt
+from pathlib import Path
+from typing import Any
+
+from orjson import OPT_INDENT_2, dumps, loads
+
+from benchmarks.seed import PACKAGE_ROOT, get_commit
+
+RESULTS_PATH = PACKAGE_ROOT / "benchmarks" / "results"
+
+
+def _access_token_claims():
+    from app.schemas.base import AccessTokenClaims
+    from app.types.base import AuthorityEnum, UserTypeEnum
+
+    return AccessTokenClaims(
+        id=1,
+        login_id="developer",
+        name="개발자",
+        type=UserTypeEnum.ADMIN,
+        manager_flag=False,
+        authorities=[AuthorityEnum.NOTICE_VIEW, AuthorityEnum.NOTICE_EDIT],
+    )
+
+
+def bench_create_access_token() -> Callable[[], Any]:
+    from app.utils.jwt import create_access_token
+
+    claims = _access_token_claims()
+    return lambda: create_access_token(claims)
+
+
+def bench_get_access_token_claims() -> Callable[[], Any]:
+    from app.utils.jwt import create_access_token, get_access_token_claims
+
+    token = create_access_token(_access_token_claims())
+    return lambda: get_access_token_claims(token)
+
+
+def bench_get_verified_access_token_claims_cached() -> Callable[[], Any]:
+    from app.utils.jwt import create_access_token, get_verified_access_token_claims
+
+    token = create_access_token(_access_token_claims())
+    get_verified_access_token_claims(token)
+    return lambda: get_verified_access_token_claims(token)
+
+
+def bench_truncate_password_ascii() -> Callable[[], Any]:
+    from app.utils.password import _truncate_password_to_72_bytes
+
+    return lambda: _truncate_password_to_72_bytes("password-1234!")
+
+
+def bench_truncate_password_multibyte_long() -> Callable[[], Any]:
+    from app.utils.password import _truncate_password_to_72_bytes
+
+    # 3바이트 문자가 72바이트 경계에 걸쳐 잘리는 경우
+    password = "a" + "비밀번호" * 30
+    return lambda: _truncate_password_to_72_bytes(password)
+
+
+def bench_tzdatetime_bind_param() -> Callable[[], Any]:
+    from sqlalchemy.dialects import mysql
+
+    from app.dependencies.orm import TZDateTime
+
+    type_, dialect = TZDateTime(), mysql.dialect()
+    value = datetime(2026, 1, 2, 3, 4, 5, 678_901, tzinfo=UTC) + timedelta(hours=9)
+    return lambda: type_.process_bind_param(value, dialect)
+
+
+def bench_tzdatetime_result_value() -> Callable[[], Any]:
+    from sqlalchemy.dialects import mysql
+
+    from app.dependencies.orm import TZDateTime
+
+    type_, dialect = TZDateTime(), mysql.dialect()
+    # DB 드라이버는 tzinfo 가 없는 datetime 을 돌려준다
+    value = datetime(2026, 1, 2, 3, 4, 5, 678_901)  # noqa: DTZ001
+    return lambda: type_.process_result_value(value, dialect)
+
+
+def bench_custom_json_serializer_set() -> Callable[[], Any]:
+    from app.dependencies.database import custom_json_serializer
+    from app.types.base import AuthorityEnum
+
+    authorities = set(AuthorityEnum)
+    return lambda: custom_json_serializer(authorities)
+
+
+def bench_custom_json_serializer_dict() -> Callable[[], Any]:
+    from app.dependencies.database import custom_json_serializer
+
+    value = {"nickname": "벤치마크", "tags": ["a", "b", "c"], "settings": {"push": True, "email": False}}
+    return lambda: custom_json_serializer(value)
+
+
+def bench_list_result_model_validate() -> Callable[[], Any]:
+    """ORM 행 100개(작업자 정보가 채워진 상태)를 ListResult[UserResponse] 로 변환"""
+    from app.models.admin import Admin  # noqa: F401 - User 관계의 Admin 매핑을 등록
+    from app.models.user import User
+    from app.schemas.base import ListResult, UserSimpleDto
+    from app.schemas.user import UserResponse
+    from app.types.base import AuthorityEnum, UserTypeEnum
+
+    now = datetime.now(UTC)
+    operator = UserSimpleDto(id=1, type=UserTypeEnum.ADMIN, login_id="developer", name="개발자")
+    rows = []
+    for index in range(1, 101):
+        user = User(
+            id=index,
+            login_id=f"user{index}",
+            name=f"사용자{index}",
+            use_flag=True,
+            authorities={AuthorityEnum.NOTICE_VIEW},
+            removed_flag=False,
+            joined_at=now,
+            latest_active_at=now,
+            created_at=now,
+            created_object_id=1,
+            created_object_type=UserTypeEnum.ADMIN,
+            updated_at=now,
+            updated_object_id=1,
+            updated_object_type=UserTypeEnum.ADMIN,
+        )
+        user.set_resolved_operators(operator, operator)
+        rows.append(user)
+
+    page = {"page": 1, "page_size": 100, "total": 100, "items": rows}
+    return lambda: ListResult[UserResponse].model_validate(page)
+
+
+BENCHMARKS: dict[str, Callable[[], Callable[[], Any]]] = {
+    name.removeprefix("bench_"): function
+    for name, function in dict(globals()).items()
+    if name.startswith("bench_") and callable(function)
+}
+
+
+def _time(func: Callable[[], Any], loops: int) -> float:
+    """func 를 loops 번 호출하는 데 걸린 시간(초)"""
+    iterations = range(loops)
+    start = time.perf_counter()
+    for _ in iterations:
+        func()
+    return time.perf_counter() - start
+
+
+def _calibrate(func: Callable[[], Any], min_time: float) -> int:
+    loops = 1
+    while _time(func, loops) < min_time:
+        loops *= 2
+    return loops
+
+
+def run_worker(name: str, values: int, warmups: int, min_time: float) -> dict[str, Any]:
+    """한 프로세스 안에서 벤치마크 하나를 측정. 값은 호출 1회당 시간(초)"""
+    func = BENCHMARKS[name]()
+    loops = _calibrate(func, min_time)
+    for _ in range(warmups):
+        _time(func, loops)
+    return {"loops": loops, "values": [_time(func, loops) / loops for _ in range(values)]}
+
+
+def run_benchmark(name: str, args: argparse.Namespace) -> dict[str, Any]:
+    """--processes 개의 하위 프로세스에서 측정한 값을 모은다"""
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks.micro",
+        "--worker",
+        name,
+        "--values",
+        str(args.values),
+        "--warmups",
+        str(args.warmups),
+        "--min-time",
+        str(args.min_time),
+    ]
+    values: list[float] = []
+    loops = 0
+    for _ in range(args.processes):
+        output = subprocess.check_output(command, cwd=PACKAGE_ROOT, env=os.environ.copy())
+        result = loads(output.splitlines()[-1])
+        values += result["values"]
+        loops = result["loops"]
+    return {
+        "loops": loops,
+        "values": values,
+        "mean": statistics.fmean(values),
+        "stdev": statistics.stdev(values) if len(values) > 1 else 0.0,
+        "median": statistics.median(values),
+        "min": min(values),
+    }
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("ns", 1e-9), ("us", 1e-6), ("ms", 1e-3)):
+        if seconds < scale * 1000:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds:.2f} s"
+
+
+def _compare(result: dict[str, Any], baseline: dict[str, Any]) -> str:
+    n1, n2 = len(result["values"]), len(baseline["values"])
+    error = sqrt(result["stdev"] ** 2 / n1 + baseline["stdev"] ** 2 / n2)
+    t = (result["mean"] - baseline["mean"]) / error if error else 0.0
+    ratio = baseline["mean"] / result["mean"]
+    if abs(t) <= 2:
+        return "차이 없음"
+    return f"{ratio:.2f}x faster" if ratio > 1 else f"{1 / ratio:.2f}x slower"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", help="이름에 이 문자열이 포함된 벤치마크만 실행")
+    parser.add_argument("--processes", type=int, default=4, help="벤치마크마다 띄울 하위 프로세스 수")
+    parser.add_argument("--values", type=int, default=5, help="프로세스마다 모을 값의 수")
+    parser.add_argument("--warmups", type=int, default=1, help="프로세스마다 버릴 워밍업 값의 수")
+    parser.add_argument("--min-time", type=float, default=0.1, help="값 하나를 측정하는 최소 시간(초)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본: benchmarks/results/micro-<commit>.json)")
+    parser.add_argument("--baseline", type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DEPLOYMENT_ENVIRONMENT", "test")
+    if args.worker:
+        print(dumps(run_worker(args.worker, args.values, args.warmups, args.min_time)).decode())
+        return 0
+
+    baseline = loads(args.baseline.read_bytes())["benchmarks"] if args.baseline else {}
+    results = {}
+    for name in BENCHMARKS:
+        if args.filter and args.filter not in name:
+            continue
+        result = results[name] = run_benchmark(name, args)
+        line = f"{name:<45} {_format_time(result['mean']):>12} +- {_format_time(result['stdev']):>10}"
+        line += f"  (median {_format_time(result['median'])}, {len(result['values'])} values x {result['loops']} loops)"
+        if name in baseline:
+            line += f"  vs baseline {_format_time(baseline[name]['mean'])}: {_compare(result, baseline[name])}"
+        print(line)
+
+    commit = get_commit()
+    output = args.output or RESULTS_PATH / f"micro-{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    meta = {"commit": commit, "created_at": datetime.now(UTC).isoformat(), "python": sys.version.split()[0]}
+    output.write_bytes(dumps({"meta": meta, "benchmarks": results}, option=OPT_INDENT_2))
+    print(f"\nsaved: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+"""서비스 조회 쿼리 실행 계획 회귀 검사
+
+migrations/ 의 스키마를 전용 데이터베이스(<DB_NAME>_query_plan)에 새로 만들고 데이터를 채운 뒤, 서비스의 조회 함수를
+*ListRequest 필터의 모든 조합과 허용된 모든 정렬로 실행하면서 나간 SELECT 를 모아 EXPLAIN FORMAT=JSON 으로 확인한다.
+
+    DEPLOYMENT_ENVIRONMENT=local python -m benchmarks.query_plan [--rows 20000] [--max-scan-ratio 0.1] [--strict]
+
+다음 중 하나라도 해당하면 실패(exit 1)한다.
+- 어떤 테이블이라도 full table scan(access_type ALL) 이거나 사용하는 인덱스가 없는 경우
+- 목록 정렬을 인덱스 순서로 읽지 못해 filesort 가 필요한 경우 (검색 관련도 정렬은 제외)
+- 단건 조회의 예상 행 수(rows_examined_per_scan)가 1 을 넘는 경우
+- 필터를 지정한 목록 조회의 예상 행 수가 --rows x --max-scan-ratio 를 넘는 경우
+
+모든 목록 조회는 removed_flag 로 시작하는 인덱스를 타므로 인덱스 사용 여부만으로는 필터가 인덱스로 처리되는지 알 수 없어,
+필터를 지정한 경우에는 예상 행 수로 확인한다. 인덱스로 처리할 수 없다고 알려진 필터(UNINDEXED_FILTERS)만 지정한 경우는
+실패 대신 WARN 으로 표시하고, --strict 를 주면 이 경우도 실패로 처리한다.
+"""
+
+import argparse
+import asyncio
+import sys
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import product
+from math import ceil
+from typing import Any
+
+from orjson import loads
+
+from benchmarks.seed import connect, load_schema, use_database
+
+
+@dataclass
+class Case:
+    """검사 단위: 서비스 호출 하나와 그 호출에서 나간 SELECT 목록"""
+
+    name: str
+    call: Callable[[], Awaitable[Any]]
+    # 단건 조회와 필터를 지정한 목록 조회처럼 예상 행 수의 상한이 있는 경우
+    max_rows: int | None = None
+    # 인덱스로 처리할 수 없다고 알려진 필터만 지정한 경우 그 이유 (상한을 넘어도 WARN 으로만 표시)
+    accepted_scan: str | None = None
+    statements: list[tuple[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class PlanResult:
+    case: Case
+    statement: str
+    accesses: list[dict[str, Any]]
+    failures: list[str]
+    warnings: list[str]
+
+
+def _options(name: str, *values: Any) -> list[dict[str, Any]]:
+    """필터 하나의 샘플: 지정하지 않은 경우 + 값별로 지정한 경우"""
+    return [{}] + [{name: value} for value in values]
+
+
+def _iter_requests[T](request_cls: type[T], samples: list[list[dict[str, Any]]]) -> Iterator[T]:
+    """필터별 샘플의 모든 조합으로 요청을 만든다"""
+    for combination in product(*samples):
+        yield request_cls(**{key: value for option in combination for key, value in option.items()})
+
+
+def _get_filters(request: Any) -> dict[str, Any]:
+    """페이지네이션과 filter_modifiers(예: login_id_match)를 제외하고 지정된 필터"""
+    from app.schemas.base import Pagination
+
+    return {
+        name: value
+        for name, value in request
+        if value is not None and name not in Pagination.model_fields and name not in request.filter_modifiers
+    }
+
+
+def _is_short_term(value: str) -> bool:
+    from app.core.config import get_settings
+
+    return len(value) < get_settings().fulltext_min_term_length
+
+
+# 목록별로 인덱스로 처리할 수 없다고 알려진 필터: 필터 이름 -> (요청 -> 이유, 인덱스로 처리되는 값이면 None)
+UNINDEXED_FILTERS: dict[str, dict[str, Callable[[Any], str | None]]] = {
+    "get_admins": {
+        "use_flag": lambda _request: "use_flag 는 선택도가 낮은 플래그",
+        "manager_flag": lambda _request: "manager_flag 는 선택도가 낮은 플래그",
+        "name": lambda _request: "관리자 이름 부분 일치는 FULLTEXT 인덱스가 없음",
+        "login_id": lambda request: (
+            "login_id CONTAINS 는 인덱스를 탈 수 없음" if request.login_id_match == "CONTAINS" else None
+        ),
+    },
+    "get_users": {
+        "use_flag": lambda _request: "use_flag 는 선택도가 낮은 플래그",
+        "name": lambda request: "ngram 토큰보다 짧은 검색어는 ILIKE 로 대체" if _is_short_term(request.name) else None,
+        "login_id": lambda request: (
+            "login_id CONTAINS 는 인덱스를 탈 수 없음" if request.login_id_match == "CONTAINS" else None
+        ),
+    },
+    "get_notices": {
+        "use_flag": lambda _request: "use_flag 는 선택도가 낮은 플래그",
+        "title": lambda request: (
+            "ngram 토큰보다 짧은 검색어는 ILIKE 로 대체" if _is_short_term(request.title) else None
+        ),
+        "keyword": lambda request: (
+            "ngram 토큰보다 짧은 검색어는 ILIKE 로 대체" if _is_short_term(request.keyword) else None
+        ),
+    },
+}
+
+
+def _get_accepted_scan(name: str, request: Any) -> str | None:
+    """지정된 필터가 모두 인덱스로 처리할 수 없다고 알려진 필터이면 그 이유, 하나라도 인덱스로 처리되는 필터가 있으면 None"""
+    reasons = []
+    for filter_name in _get_filters(request):
+        reason_of = UNINDEXED_FILTERS[name].get(filter_name)
+        reason = reason_of(request) if reason_of is not None else None
+        if reason is None:
+            return None
+        reasons.append(reason)
+    return ", ".join(dict.fromkeys(reasons))
+
+
+def _describe(request: Any) -> str:
+    fields = request.model_dump(exclude_defaults=True, by_alias=True)
+    return ",".join(f"{key}={value}" for key, value in fields.items()) or "-"
+
+
+def build_cases(max_scan_rows: int) -> list[Case]:
+    from app.schemas.admin import AdminListRequest
+    from app.schemas.notice import NoticeListRequest
+    from app.schemas.user import UserListRequest
+    from app.services import admin, notice, user
+    from app.types.base import LoginIdMatchEnum
+    from app.utils.pagination import SortRegistry
+
+    cases: list[Case] = []
+
+    def add_list_cases(
+        name: str,
+        service: Callable[[Any], Awaitable[Any]],
+        request_cls: type,
+        samples: list[list[dict[str, Any]]],
+        sort_registry: SortRegistry,
+    ) -> None:
+        requests = list(_iter_requests(request_cls, samples))
+        requests += [request_cls(ordering=ordering) for ordering in sort_registry.names]
+        for request in requests:
+            filtered = bool(_get_filters(request))
+            cases.append(
+                Case(
+                    f"{name}[{_describe(request)}]",
+                    partial(service, request),
+                    max_rows=max_scan_rows if filtered else None,
+                    accepted_scan=_get_accepted_scan(name, request) if filtered else None,
+                )
+            )
+
+    # login_id 는 검색 방식(login_id_match)과 함께 하나의 샘플로 조합한다
+    login_id_samples: list[dict[str, Any]] = [{}] + [
+        {"login_id": "seed1", "login_id_match": match}
+        for match in (None, LoginIdMatchEnum.CONTAINS, LoginIdMatchEnum.EXACT)
+    ]
+    add_list_cases(
+        "get_admins",
+        admin.get_admins,
+        AdminListRequest,
+        [
+            _options("id", 2),
+            login_id_samples,
+            _options("name", "관리자1", "관"),
+            _options("use_flag", True),
+            _options("manager_flag", True),
+        ],
+        admin.sort_registry,
+    )
+    add_list_cases(
+        "get_users",
+        user.get_users,
+        UserListRequest,
+        [_options("id", 2), login_id_samples, _options("name", "사용자1", "사"), _options("use_flag", True)],
+        user.sort_registry,
+    )
+    add_list_cases(
+        "get_notices",
+        notice._select_notices,
+        NoticeListRequest,
+        [
+            _options("id", 2),
+            _options("title", "공지1", "공"),
+            _options("keyword", "본문1", "본"),
+            _options("use_flag", True),
+        ],
+        notice.sort_registry,
+    )
+
+    cases += [
+        Case("get_admin", lambda: admin.get_admin(2), max_rows=1),
+        Case("get_user", lambda: user.get_user(2), max_rows=1),
+        Case("get_notice", lambda: notice._select_notice(2), max_rows=1),
+        Case("admin.check_login_id", lambda: admin.check_login_id("seed1", None), max_rows=1),
+        Case("admin.check_login_id[exclude self]", lambda: admin.check_login_id("seed1", 1), max_rows=1),
+        Case("user.check_login_id", lambda: user.check_login_id("seed1", None), max_rows=1),
+        Case("user.check_login_id[exclude self]", lambda: user.check_login_id("seed1", 1), max_rows=1),
+    ]
+    return cases
+
+
+async def collect_statements(cases: list[Case]) -> None:
+    """각 Case 를 실행하며 나간 SELECT 를 Case 에 기록 (캐시는 매번 비워 실제 쿼리가 나가도록 한다)"""
+    from sqlalchemy import Engine, event
+
+    from app.dependencies.database import async_db_manager
+    from app.services.operator import operator_cache
+    from app.utils.pagination import count_cache
+
+    current: list[Case] = []
+
+    def before_cursor_execute(_conn, _cursor, statement, parameters, _context, _executemany) -> None:
+        if current and statement.lstrip().upper().startswith("SELECT"):
+            current[0].statements.append((statement, parameters))
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        for case in cases:
+            operator_cache.clear()
+            count_cache.clear()
+            current[:] = [case]
+            await case.call()
+    finally:
+        current.clear()
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+        await async_db_manager.close()
+
+
+def _iter_table_accesses(node: Any) -> Iterator[dict[str, Any]]:
+    if isinstance(node, dict):
+        if "access_type" in node:
+            yield node
+        for value in node.values():
+            yield from _iter_table_accesses(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _iter_table_accesses(value)
+
+
+def _uses_filesort(node: Any) -> bool:
+    if isinstance(node, dict):
+        return node.get("using_filesort") is True or any(_uses_filesort(value) for value in node.values())
+    if isinstance(node, list):
+        return any(_uses_filesort(value) for value in node)
+    return False
+
+
+def check_plan(case: Case, statement: str, plan: dict[str, Any], strict: bool) -> PlanResult:
+    accesses = list(_iter_table_accesses(plan))
+    failures: list[str] = []
+    warnings: list[str] = []
+    # 알려진 필터만 지정한 경우의 예상 행 수/full scan 은 --strict 가 아니면 경고로만 남긴다
+    scan_problems = warnings if case.accepted_scan and not strict else failures
+    for access in accesses:
+        table = access.get("table_name")
+        if access["access_type"] == "ALL":
+            scan_problems.append(f"{table}: full table scan (rows={access.get('rows_examined_per_scan')})")
+        elif not access.get("key"):
+            failures.append(f"{table}: 사용하는 인덱스 없음 (access_type={access['access_type']})")
+        if case.max_rows is not None and access.get("rows_examined_per_scan", 0) > case.max_rows:
+            scan_problems.append(f"{table}: 예상 행 수 {access['rows_examined_per_scan']} > {case.max_rows}")
+    if warnings:
+        warnings.append(f"인덱스로 처리할 수 없는 필터: {case.accepted_scan}")
+
+    is_relevance_ordered = "MATCH (" in statement and "ORDER BY" in statement
+    if "ORDER BY" in statement and not is_relevance_ordered and _uses_filesort(plan):
+        failures.append("정렬이 인덱스로 처리되지 않음 (using_filesort)")
+    return PlanResult(case, statement, accesses, failures, warnings)
+
+
+def explain(database: str, cases: list[Case], strict: bool) -> list[PlanResult]:
+    results = []
+    seen: set[tuple[str, str]] = set()
+    with connect(database) as connection, connection.cursor() as cursor:
+        for case in cases:
+            for statement, parameters in case.statements:
+                key = (statement, repr(parameters))
+                if key in seen:
+                    continue
+                seen.add(key)
+                cursor.execute(f"EXPLAIN FORMAT=JSON {statement}", parameters)
+                plan = loads(cursor.fetchone()[0])
+                results.append(check_plan(case, statement, plan, strict))
+    return results
+
+
+def _format_access(access: dict[str, Any]) -> str:
+    return (
+        f"{access.get('table_name')}:{access['access_type']}"
+        f"/{access.get('key') or '-'}/rows={access.get('rows_examined_per_scan', '-')}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000, help="테이블별로 채울 행 수")
+    parser.add_argument(
+        "--max-scan-ratio", type=float, default=0.1, help="필터를 지정한 목록 조회의 예상 행 수 상한 (--rows 대비 비율)"
+    )
+    parser.add_argument("--strict", action="store_true", help="인덱스로 처리할 수 없다고 알려진 필터도 실패로 처리")
+    parser.add_argument("--verbose", action="store_true", help="통과한 쿼리의 실행 계획도 출력")
+    args = parser.parse_args()
+
+    database = use_database("query_plan")
+    load_schema(database, args.rows)
+    cases = build_cases(max_scan_rows=ceil(args.rows * args.max_scan_ratio))
+    asyncio.run(collect_statements(cases))
+    results = explain(database, cases, args.strict)
+
+    failed = [result for result in results if result.failures]
+    warned = [result for result in results if result.warnings and not result.failures]
+    for result in results:
+        if result.failures or result.warnings or args.verbose:
+            status = "FAIL" if result.failures else "WARN" if result.warnings else "OK  "
+            print(f"{status}  {result.case.name}  {' '.join(_format_access(a) for a in result.accesses)}")
+            for problem in result.failures + result.warnings:
+                print(f"        - {problem}")
+            if result.failures:
+                print(f"        {' '.join(result.statement.split())}")
+    print(f"{len(cases)} cases, {len(results)} statements, {len(failed)} failed, {len(warned)} warned")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
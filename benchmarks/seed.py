@@ -0,0 +1,109 @@
+"""benchmarks 공용: migrations/ 스키마를 전용 데이터베이스에 만들고 데이터를 채운다. 결과 파일에 남길 커밋도 여기서 구한다"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+MIGRATIONS_PATH = PACKAGE_ROOT / "migrations"
+
+
+def use_database(suffix: str) -> str:
+    """설정의 DB_NAME 뒤에 suffix 를 붙인 전용 데이터베이스를 앱이 바라보도록 하고, 그 이름을 반환
+
+    app 의 엔진이 만들어지기 전에 호출해야 한다.
+    """
+    os.environ.setdefault("DEPLOYMENT_ENVIRONMENT", "local")
+    from app.core.config import get_settings
+
+    database = os.environ.get("BENCHMARK_DB_NAME") or f"{get_settings().db_name}_{suffix}"
+    os.environ["DB_NAME"] = database
+    get_settings.cache_clear()
+    return database
+
+
+def connect(database: str | None = None):
+    import pymysql  # type: ignore[import-untyped]
+    from pymysql.constants import CLIENT  # type: ignore[import-untyped]
+
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    return pymysql.connect(
+        host=settings.db_host,
+        port=int(settings.db_port),
+        user=settings.db_username,
+        password=settings.db_password,
+        database=database,
+        charset="utf8mb4",
+        autocommit=True,
+        client_flag=CLIENT.MULTI_STATEMENTS,
+    )
+
+
+def _execute_script(cursor, sql: str) -> None:
+    cursor.execute(sql)
+    while cursor.nextset():
+        pass
+
+
+def _seed_sql(rows: int) -> str:
+    # 10% 는 삭제된 행으로 두어 removed_flag 조건의 선택도가 실제와 비슷하도록 한다
+    seq = f"WITH RECURSIVE seq (n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < {rows})"
+    audit = "NOW() - INTERVAL n MINUTE, 1, 'ADMIN', NOW() - INTERVAL n MINUTE, 1, 'ADMIN'"
+    audit_columns = (
+        "created_at, created_object_id, created_object_type, updated_at, updated_object_id, updated_object_type"
+    )
+    return f"""
+SET SESSION cte_max_recursion_depth = {rows + 1};
+INSERT INTO admins (name, use_flag, manager_flag, login_id, authorities, removed_flag, {audit_columns})
+{seq} SELECT CONCAT('관리자', n), n % 2, n % 5 = 0, CONCAT('seed', n), '[]', n % 10 = 0, {audit} FROM seq;
+INSERT INTO users (name, use_flag, login_id, authorities, removed_flag, {audit_columns})
+{seq} SELECT CONCAT('사용자', n), n % 2, CONCAT('seed', n), '[]', n % 10 = 0, {audit} FROM seq;
+INSERT INTO notices (title, content, use_flag, removed_flag, {audit_columns})
+{seq} SELECT CONCAT('공지', n), CONCAT('본문', n), n % 2, n % 10 = 0, {audit} FROM seq;
+ANALYZE TABLE admins, users, notices;
+"""
+
+
+def load_schema(database: str, rows: int) -> None:
+    """전용 데이터베이스를 다시 만들고 migrations 를 버전 순서대로 적용한 뒤 테이블마다 rows 개의 행을 채운다
+
+    로그인 아이디는 seed1, seed2, ... 이고, 10 의 배수 번째 행은 삭제된 상태다.
+    """
+    from app.dependencies.orm import Base
+
+    migrations = sorted(MIGRATIONS_PATH.glob("V*__*.sql"), key=lambda path: int(path.name[1:].split("__")[0]))
+    with connect() as connection, connection.cursor() as cursor:
+        cursor.execute(f"DROP DATABASE IF EXISTS `{database}`")
+        cursor.execute(f"CREATE DATABASE `{database}` CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci")
+        cursor.execute(f"USE `{database}`")
+        for path in migrations:
+            _execute_script(cursor, path.read_text())
+        _execute_script(cursor, _seed_sql(rows))
+
+        # 모델의 테이블 이름이 migrations 와 다르면(단수/복수) 전용 데이터베이스에서만 이름을 맞춘다
+        cursor.execute("SHOW TABLES")
+        tables = {row[0] for row in cursor.fetchall()}
+        for table_name in Base.metadata.tables:
+            if table_name not in tables and f"{table_name}s" in tables:
+                print(
+                    f"WARN  모델 테이블 {table_name!r} 이 migrations 에는 {table_name}s 로 정의되어 있음",
+                    file=sys.stderr,
+                )
+                cursor.execute(f"RENAME TABLE `{table_name}s` TO `{table_name}`")
+
+
+def get_commit() -> str:
+    """현재 커밋의 짧은 해시. app/ 에 커밋되지 않은 변경이 있으면 -dirty 를 붙인다"""
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PACKAGE_ROOT, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+        dirty = subprocess.check_output(
+            ["git", "status", "--porcelain", "--", "app"], cwd=PACKAGE_ROOT, text=True, stderr=subprocess.DEVNULL
+        )
+    except (OSError, subprocess.CalledProcessError):  # fmt: skip
+        return "unknown"
+    return f"{commit}-dirty" if dirty.strip() else commit
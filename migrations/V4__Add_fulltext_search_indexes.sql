@@ -0,0 +1,8 @@
+-- 부분 일치 검색(ILIKE '%검색어%')이 인덱스를 타지 못해 full scan 되는 것을 막기 위한 n-gram FULLTEXT 인덱스
+-- ngram_token_size(기본 2) 보다 짧은 검색어는 애플리케이션에서 ILIKE 로 대체한다
+ALTER TABLE notices
+    ADD FULLTEXT INDEX ftx_notices_title (title) WITH PARSER ngram,
+    ADD FULLTEXT INDEX ftx_notices_title_content (title, content) WITH PARSER ngram;
+
+ALTER TABLE users
+    ADD FULLTEXT INDEX ftx_users_name (name) WITH PARSER ngram;
@@ -0,0 +1,11 @@
+-- 목록 정렬(SortRegistry) 마다 removed_flag 조건과 정렬을 함께 처리하는 인덱스
+-- InnoDB 보조 인덱스는 PK(id) 를 뒤에 포함하므로 id tie-break 까지 인덱스 순서로 읽는다
+ALTER TABLE notices
+    ADD INDEX idx_notices_removed_flag_id (removed_flag, id),
+    ADD INDEX idx_notices_removed_flag_created_at (removed_flag, created_at);
+
+ALTER TABLE admins
+    ADD INDEX idx_admins_removed_flag_created_at (removed_flag, created_at);
+
+ALTER TABLE users
+    ADD INDEX idx_users_removed_flag_created_at (removed_flag, created_at);